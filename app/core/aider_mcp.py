@@ -14,7 +14,7 @@ from app.tools.ai_coding_tools import code_with_ai, code_with_multiple_ai
 from app.tools.health_monitoring_tools import get_system_health
 
 # Import infrastructure components
-from app.core.resilience import resilience_manager
+from app.core.resilience import get_resilience_manager
 
 # Create MCP server instance
 mcp = FastMCP("Aider Coder")
@@ -99,7 +99,8 @@ def get_system_health() -> str:
 # Initialize resilience manager
 def initialize_server():
     """Initialize the MCP server with all necessary infrastructure."""
-    # Resilience manager is automatically initialized as singleton
+    # Start the resilience monitors (the singleton is created lazily on first use)
+    get_resilience_manager()
     print("🚀 MCP Server initialized with modular architecture")
     print("📋 Registered tools:")
     print("  - Planning: planning_tool, plan_from_scratch_tool")
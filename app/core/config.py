@@ -99,6 +99,7 @@ class CostConfig:
     max_daily_cost_usd: float = field(default_factory=lambda: _env_float("MAX_DAILY_COST", 20.0))
     max_monthly_cost_usd: float = field(default_factory=lambda: _env_float("MAX_MONTHLY_COST", 300.0))
     enable_cost_tracking: bool = field(default_factory=lambda: _env_bool("ENABLE_COST_TRACKING", True))
+    flush_batch_size: int = field(default_factory=lambda: _env_int("COST_FLUSH_BATCH", 10)) # Recorded tasks between cost history saves (also saved on exit)
     # Fallback token costs if model not in detailed pricing (per token, not per 1k tokens)
     fallback_cost_per_token_input: float = field(default_factory=lambda: _env_float("FALLBACK_COST_PER_TOKEN_INPUT", 0.000002)) # Example: $0.002/1k tokens
     fallback_cost_per_token_output: float = field(default_factory=lambda: _env_float("FALLBACK_COST_PER_TOKEN_OUTPUT", 0.000005)) # Example: $0.005/1k tokens
@@ -156,9 +157,11 @@ class LoggingConfig:
     log_level: str = field(default_factory=lambda: _env_str("LOG_LEVEL", "INFO").upper())
     log_file_path: str = field(default_factory=lambda: _env_str("LOG_FILE_PATH", "logs/current/app_log.json"))
     log_format: str = field(default_factory=lambda: _env_str("LOG_FORMAT", "json")) # "json" or "text"
+    log_file_format: str = field(default_factory=lambda: _env_str("LOG_FILE_FORMAT", "json").lower()) # "json" or "msgpack" (*_YYYY-MM.mpack)
     log_rotation_policy: str = field(default_factory=lambda: _env_str("LOG_ROTATION_POLICY", "monthly")) # "daily", "weekly", "monthly", "size"
     log_rotation_max_size_mb: int = field(default_factory=lambda: _env_int("LOG_ROTATION_MAX_SIZE_MB", 100))
     log_rotation_backup_count: int = field(default_factory=lambda: _env_int("LOG_ROTATION_BACKUP_COUNT", 5))
+    log_rotation_compress: bool = field(default_factory=lambda: _env_bool("LOG_ROTATION_COMPRESS", False)) # gzip rotated backups (operational.log.1.gz, ...)
     enable_console_logging: bool = field(default_factory=lambda: _env_bool("ENABLE_CONSOLE_LOGGING", True))
     enable_file_logging: bool = field(default_factory=lambda: _env_bool("ENABLE_FILE_LOGGING", False)) # To explicitly enable/disable file logging
     enable_auto_detection_logging: bool = field(default_factory=lambda: _env_bool("ENABLE_AUTO_DETECTION_LOGGING", True))
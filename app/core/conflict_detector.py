@@ -5,6 +5,15 @@ from pathlib import Path
 from typing import List, Dict, Set, Any, Optional, Tuple, Union
 from collections import defaultdict
 
+
+class _FallbackFeaturesConfig:
+    """Conflict detection defaults used when the application config is unavailable."""
+    enable_conflict_detection = True
+    conflict_detection_timeout = 5
+    enable_conflict_logging = True
+    conflict_report_verbosity = "standard"
+
+
 # Assuming get_logger is available from app.core.logging
 try:
     from app.core.logging import get_logger
@@ -15,19 +24,46 @@ except ImportError:
     def get_logger(name, log_category="operational"):
         return logging.getLogger(name)
     # Dummy Config class for standalone testing
-    class DummyFeaturesConfig:
-        enable_conflict_detection = True
-        conflict_detection_timeout = 5
-        enable_conflict_logging = True
-        conflict_report_verbosity = "standard"
     class DummyConfig:
-        features = DummyFeaturesConfig()
+        features = _FallbackFeaturesConfig
     def get_config():
         return DummyConfig()
 
 
 logger = get_logger(__name__, "operational")
 
+# Task file lists at or below this size are intersected with a merge walk over
+# sorted tuples instead of building a new set for every task pair.
+_SMALL_FILE_LIST_SIZE = 16
+
+
+def _sorted_intersect(files1: Tuple[str, ...], files2: Tuple[str, ...]) -> List[str]:
+    """
+    Intersects two sorted tuples of unique file paths with a two-pointer merge.
+
+    Args:
+        files1 (Tuple[str, ...]): Sorted, de-duplicated file paths.
+        files2 (Tuple[str, ...]): Sorted, de-duplicated file paths.
+
+    Returns:
+        List[str]: The paths present in both tuples, in sorted order.
+    """
+    common_files = []
+    i = j = 0
+    len1, len2 = len(files1), len(files2)
+    while i < len1 and j < len2:
+        file1, file2 = files1[i], files2[j]
+        if file1 == file2:
+            common_files.append(file1)
+            i += 1
+            j += 1
+        elif file1 < file2:
+            i += 1
+        else:
+            j += 1
+    return common_files
+
+
 class FileConflictDetector:
     """
     Detects overlapping editable files across multiple parallel tasks.
@@ -59,13 +95,10 @@ class FileConflictDetector:
 
         try:
             self.config = get_config()
-            features_config = self.config.features
+            features_config = getattr(self.config, "features", _FallbackFeaturesConfig)
         except Exception as e:
             logger.error(f"Failed to load configuration for conflict detector, using defaults: {e}")
-            # Fallback to a dummy object that will return defaults via getattr
-            class FallbackFeaturesConfig:
-                pass
-            features_config = FallbackFeaturesConfig()
+            features_config = _FallbackFeaturesConfig
 
         self.enable_conflict_detection = getattr(features_config, "enable_conflict_detection", True)
         self.conflict_detection_timeout = getattr(features_config, "conflict_detection_timeout", 5)
@@ -195,7 +228,7 @@ class FileConflictDetector:
 
         start_time = time.time()
 
-        task_file_map: Dict[str, Set[str]] = {}
+        task_file_map: Dict[str, Tuple[str, ...]] = {}
         file_task_map: Dict[str, List[str]] = defaultdict(list)
         
         # Normalize paths for each task and build initial mappings
@@ -218,7 +251,7 @@ class FileConflictDetector:
                     logger.warning(f"Task '{task_id}' has 'editable_files' that is not a list. Skipping.")
                 continue
 
-            normalized_files = self._normalize_paths_list(editable_files)
+            normalized_files = tuple(sorted(self._normalize_paths_list(editable_files)))
             task_file_map[task_id] = normalized_files
 
             for n_file in normalized_files:
@@ -252,10 +285,13 @@ class FileConflictDetector:
                 task_id1 = task_ids_list[i]
                 task_id2 = task_ids_list[j]
 
-                files1 = task_file_map.get(task_id1, set())
-                files2 = task_file_map.get(task_id2, set())
+                files1 = task_file_map.get(task_id1, ())
+                files2 = task_file_map.get(task_id2, ())
 
-                common_files = sorted(list(files1.intersection(files2)))
+                if len(files1) <= _SMALL_FILE_LIST_SIZE and len(files2) <= _SMALL_FILE_LIST_SIZE:
+                    common_files = _sorted_intersect(files1, files2)
+                else:
+                    common_files = sorted(set(files1).intersection(files2))
                 if common_files:
                     conflict_matrix[(task_id1, task_id2)] = common_files
 
@@ -1,20 +1,199 @@
+import atexit
+import codecs
+import copy
+import functools
 import logging
 import json
+import os
+import gzip
+import queue
+import shutil
+import struct
+import threading
+import time
+import traceback
 from pathlib import Path
-from datetime import datetime
-from typing import Any, Dict, Optional
-from logging.handlers import RotatingFileHandler
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to ujson or the stdlib encoder
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # ujson is optional; only used when orjson is unavailable
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for LOG_FILE_FORMAT=msgpack
+    msgpack = None
 
 from app.core.config import get_config
 
+# None of the formatters here use thread, process or multiprocessing names, so
+# stop LogRecord from looking them up for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Directories already created by _ensure_directory in this process
+_created_directories: Set[str] = set()
+_created_directories_lock = threading.Lock()
+
+
+def _ensure_directory(path: str):
+    """
+    Create a log directory (and parents) once per process.
+
+    Args:
+        path: Directory to create if it does not exist
+    """
+    if path in _created_directories:
+        return
+    with _created_directories_lock:
+        if path not in _created_directories:
+            os.makedirs(path, exist_ok=True)
+            _created_directories.add(path)
+
+
+# Every logger created through get_logger writes to the console through the same
+# StreamHandler instead of each stacking its own handler/formatter pair.
+_shared_console_handler: Optional[logging.StreamHandler] = None
+_shared_handlers_lock = threading.Lock()
+
+
+def _get_shared_console_handler(formatter: logging.Formatter) -> logging.StreamHandler:
+    """
+    Return the process-wide console handler, creating it on first use.
+
+    Args:
+        formatter: Formatter attached when the handler is first created
+
+    Returns:
+        The shared StreamHandler instance
+    """
+    global _shared_console_handler
+    if _shared_console_handler is None:
+        with _shared_handlers_lock:
+            if _shared_console_handler is None:
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(formatter)
+                _shared_console_handler = console_handler
+    return _shared_console_handler
+
+
+def _dumps_fallback(log_entry: Dict[str, Any], pretty: bool = False) -> str:
+    """Serialize with ujson if installed, otherwise (or if ujson rejects a value) with json."""
+    if ujson is not None:
+        try:
+            return ujson.dumps(log_entry, indent=2 if pretty else 0, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            # ujson is stricter than json about some values; leave those to json
+            pass
+    if pretty:
+        return json.dumps(log_entry, indent=2)
+    return json.dumps(log_entry)
+
+
+def _dumps(log_entry: Dict[str, Any], pretty: bool = False) -> str:
+    """
+    Serialize a log entry to a JSON string, preferring orjson, then ujson, then json.
+
+    Args:
+        log_entry: The log entry to serialize
+        pretty: Whether to indent the output
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(log_entry, option=option).decode("utf-8")
+        except TypeError:
+            # orjson is stricter than json (e.g. ints wider than 64 bits); let json handle it
+            pass
+    return _dumps_fallback(log_entry, pretty)
+
+
+def _dumps_bytes(log_entry: Dict[str, Any], pretty: bool = False) -> bytes:
+    """
+    Serialize a log entry to UTF-8 JSON bytes, ready to be written to a file.
+
+    orjson produces bytes natively, so this skips the decode/encode round trip
+    that going through _dumps would cost.
+
+    Args:
+        log_entry: The log entry to serialize
+        pretty: Whether to indent the output
+
+    Returns:
+        The JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except TypeError:
+            pass
+    return _dumps_fallback(log_entry, pretty).encode("utf-8")
+
+
+def _packb(log_entry: Dict[str, Any]) -> bytes:
+    """
+    Serialize a log entry to MessagePack, stringifying values msgpack cannot encode.
+
+    Args:
+        log_entry: The log entry to serialize
+
+    Returns:
+        The packed entry (without the length prefix)
+    """
+    return msgpack.packb(log_entry, use_bin_type=True, default=str)
+
+
+# Binary log files are a sequence of [uint32 big-endian length][msgpack payload] frames
+_FRAME_HEADER = struct.Struct(">I")
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp produced;
+# records logged within the same second reuse the prefix
+_timestamp_cache = (-1, "")
+
+
+def _utc_timestamp(created: float) -> str:
+    """
+    Format an epoch timestamp as an ISO-8601 UTC string with microseconds.
+
+    Args:
+        created: Seconds since the epoch (e.g. LogRecord.created)
+
+    Returns:
+        A timestamp such as "2025-06-01T12:00:00.123456Z"
+    """
+    global _timestamp_cache
+    seconds = int(created)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        # A single tuple assignment keeps the pair consistent across threads
+        _timestamp_cache = (seconds, prefix)
+    return prefix + ".%06dZ" % int((created - seconds) * 1_000_000)
+
 
 class MonthlyRotatingFileHandler(logging.FileHandler):
     """
     A custom file handler that automatically rotates log files monthly.
     Creates files like: base_name_2025-06.json, base_name_2025-07.json, etc.
+
+    Text records are written one per line. Bytes records (from a binary
+    formatter) are written as length-prefixed frames instead.
     """
 
-    def __init__(self, base_path, base_name, mode='a', encoding=None, delay=False):
+    def __init__(self, base_path, base_name, mode='a', encoding='utf-8', delay=False, extension=".json"):
         """
         Initialize the monthly rotating file handler.
 
@@ -24,77 +203,533 @@ class MonthlyRotatingFileHandler(logging.FileHandler):
             mode: File mode (default 'a' for append)
             encoding: File encoding
             delay: Whether to delay file opening
+            extension: File name extension (e.g. '.json', '.mpack')
         """
         self.base_path = Path(base_path)
         self.base_name = base_name
-        self.current_month = None
+        self.extension = extension
+        # Everything in the file path except the month, so rollover is plain concatenation
+        self._path_prefix = os.path.join(os.path.abspath(self.base_path), f"{base_name}_")
+        now = time.time()
+        self.current_month = time.strftime("%Y-%m", time.localtime(now))
+        # Epoch seconds at which the next month's file takes over
+        self._rollover_epoch = self._compute_rollover_epoch(now)
+
+        # Encoded records and terminators waiting to be written in one batch. Only
+        # used when the handler is driven by the background queue listener; otherwise
+        # every emit flushes.
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        # time.monotonic() when the oldest pending chunk was buffered
+        self._pending_since = 0.0
+        self._defer_flush = False
+        self._encoding = encoding or "utf-8"
+        self._terminator_bytes = self.terminator.encode(self._encoding)
+        self._is_utf8 = codecs.lookup(self._encoding).name == "utf-8"
+        # Set by setFormatter when the formatter can produce file-ready JSON bytes itself
+        self._format_bytes = None
 
         # Ensure directory exists
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        _ensure_directory(str(self.base_path))
 
         # Initialize with current month file
         current_file = self._get_current_file_path()
         super().__init__(current_file, mode, encoding, delay)
 
-    def _get_current_file_path(self):
+    def _open(self):
+        """
+        Open the current month's file as an unbuffered append-only binary stream.
+
+        Records are written straight to its descriptor with os.writev, so no
+        text-layer buffering or newline translation sits in between.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        flags |= os.O_APPEND if "a" in self.mode else os.O_TRUNC
+        fd = os.open(self.baseFilename, flags, 0o644)
+        return os.fdopen(fd, "wb", buffering=0)
+
+    def _get_current_file_path(self) -> str:
         """Get the file path for the current month."""
-        current_month = datetime.now().strftime("%Y-%m")
-        return self.base_path / f"{self.base_name}_{current_month}.json"
+        return self._path_prefix + self.current_month + self.extension
+
+    @staticmethod
+    def _compute_rollover_epoch(now: float) -> float:
+        """Return the epoch time of the first instant of the month after `now` (local time)."""
+        current = time.localtime(now)
+        if current.tm_mon == 12:
+            year, month = current.tm_year + 1, 1
+        else:
+            year, month = current.tm_year, current.tm_mon + 1
+        return time.mktime((year, month, 1, 0, 0, 0, 0, 0, -1))
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        if self._is_utf8 and isinstance(fmt, JSONFormatter) and not fmt._binary:
+            self._format_bytes = fmt.format_bytes
+        else:
+            self._format_bytes = None
 
     def emit(self, record):
-        """Emit a log record, rotating to new file if month changed."""
-        current_month = datetime.now().strftime("%Y-%m")
+        """Buffer a log record, rotating to new file if month changed."""
+        try:
+            # Check if we need to rotate to a new month
+            now = time.time()
+            if now >= self._rollover_epoch:
+                # Pending records belong to the previous month's file
+                self._write_pending()
+                self.current_month = time.strftime("%Y-%m", time.localtime(now))
+                self._rollover_epoch = self._compute_rollover_epoch(now)
+
+                # Close current file
+                if self.stream:
+                    self.stream.close()
+                    self.stream = None
 
-        # Check if we need to rotate to a new month
-        if self.current_month != current_month:
-            self.current_month = current_month
+                # Update to new file path
+                self.baseFilename = self._get_current_file_path()
 
-            # Close current file
-            if self.stream:
-                self.stream.close()
-                self.stream = None
+            if self._format_bytes is not None:
+                head, tail = self._format_bytes(record), self._terminator_bytes
+            else:
+                payload = self.format(record)
+                if isinstance(payload, bytes):
+                    head, tail = _FRAME_HEADER.pack(len(payload)), payload
+                else:
+                    head, tail = payload.encode(self._encoding), self._terminator_bytes
 
-            # Update to new file path
-            new_file_path = self._get_current_file_path()
-            self.baseFilename = str(new_file_path)
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(head)
+            self._pending.append(tail)
+            self._pending_bytes += len(head) + len(tail)
 
-        # Call parent emit method
-        super().emit(record)
+            # Under sustained load the queue may never drain, so also bound the
+            # batch by chunk count, size and age
+            if (
+                not self._defer_flush
+                or len(self._pending) >= _MAX_PENDING_CHUNKS
+                or self._pending_bytes >= _MAX_PENDING_BYTES
+                or time.monotonic() - self._pending_since >= _MAX_FLUSH_DELAY_SECONDS
+            ):
+                self._write_pending()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
+    def _write_pending(self):
+        """Write all buffered records with a single gather write."""
+        if not self._pending:
+            return
 
-class JSONFormatter(logging.Formatter):
-    """Custom JSON formatter for structured logging"""
+        chunks, total = self._pending, self._pending_bytes
+        self._pending = []
+        self._pending_bytes = 0
 
-    def format(self, record):
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "logger": record.name,
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
+        if self.stream is None:
+            self.stream = self._open()
+        fd = self.stream.fileno()
 
-        # Add structured data if present
-        if hasattr(record, 'structured_data'):
-            log_entry["data"] = record.structured_data
+        if _writev is not None:
+            written = _writev(fd, chunks)
+            if written == total:
+                return
+            # Short write: fall through and write whatever is left
+            data = memoryview(b"".join(chunks))[written:]
+        else:
+            data = memoryview(b"".join(chunks))
 
-        # Add exception info if present
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
 
-        # Pretty print if enabled
+    def flush(self):
+        """Write any buffered records, then flush the underlying stream."""
+        self.acquire()
         try:
-            config = get_config()
-            pretty_print = getattr(config.logging, "json_pretty_print", False)
+            self._write_pending()
+            super().flush()
+        finally:
+            self.release()
+
+
+# Buffered log output is written once it reaches this size or this age, even if
+# the queue listener has not drained its queue yet
+_MAX_PENDING_BYTES = 64 * 1024
+_MAX_FLUSH_DELAY_SECONDS = 0.2
+
+# os.writev is POSIX-only; elsewhere the buffered chunks are joined and written at once
+_writev = getattr(os, "writev", None)
+
+# Upper bound on buffered chunks (a record plus its terminator is two) held before
+# writing; also kept under the platform's iovec limit so one writev call suffices.
+_MAX_PENDING_CHUNKS = 512
+if _writev is not None and hasattr(os, "sysconf"):
+    try:
+        _MAX_PENDING_CHUNKS = min(_MAX_PENDING_CHUNKS, os.sysconf("SC_IOV_MAX"))
+    except (ValueError, OSError):
+        pass
+
+
+def _gzip_namer(default_name: str) -> str:
+    """Name rotated backups with a .gz suffix."""
+    return default_name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    """
+    Compress a log file that is being rotated out, then remove the original.
+
+    Args:
+        source: The log file being rotated
+        dest: Path of the compressed backup to create
+    """
+    if not os.path.exists(source):
+        return
+    with open(source, "rb") as src, gzip.open(dest, "wb", compresslevel=3) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.remove(source)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large buffer and, when driven by the
+    background queue listener, leaves flushing to the listener instead of flushing
+    after every record.
+
+    The current file size is tracked in-process, so deciding whether to roll over
+    needs no seek/tell (which would also force the buffer out) and formats each
+    record only once.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, buffer_size=64 * 1024, compress=False):
+        """
+        Initialize the buffered rotating file handler.
+
+        Args:
+            filename: Path of the log file
+            mode: File mode (default 'a' for append)
+            maxBytes: Rotate once the file would exceed this size (0 disables rotation)
+            backupCount: Number of rotated backups to keep
+            encoding: File encoding
+            delay: Whether to delay file opening
+            buffer_size: Size of the write buffer in bytes
+            compress: Gzip rotated backups (file.log.1.gz, file.log.2.gz, ...)
+        """
+        self.buffer_size = buffer_size
+        self._defer_flush = False
+        # time.monotonic() of the last explicit flush, to bound how stale the buffer gets
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+
+        # Characters written to the current file (approximate, like the stdlib check)
+        if os.path.isfile(self.baseFilename) and "a" in mode:
+            self._approx_size = os.path.getsize(self.baseFilename)
+        else:
+            self._approx_size = 0
+        # Never rotate special files such as /dev/null
+        self._rotatable = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+
+        if compress:
+            # Rollover runs on the queue listener thread, so compressing inline
+            # does not block logging callers (and cannot race the next rename)
+            self.namer = _gzip_namer
+            self.rotator = _gzip_rotator
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+
+    def _would_overflow(self, length: int) -> bool:
+        """Check whether writing `length` more characters should trigger a rollover."""
+        return (
+            self.maxBytes > 0
+            and self._approx_size > 0
+            and self._approx_size + length >= self.maxBytes
+            and self._rotatable
+        )
+
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def shouldRollover(self, record):
+        return self._would_overflow(len(self.format(record)) + len(self.terminator))
+
+    def doRollover(self):
+        super().doRollover()
+        self._approx_size = 0
+
+    def emit(self, record):
+        """Write a record, rotating first if needed; flush only when not deferred."""
+        try:
+            msg = self.format(record) + self.terminator
+            if self._would_overflow(len(msg)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._approx_size += len(msg)
+            # The stream buffer itself caps the batch size; also cap its age
+            if not self._defer_flush or time.monotonic() - self._last_flush >= _MAX_FLUSH_DELAY_SECONDS:
+                self.flush()
+        except RecursionError:
+            raise
         except Exception:
-            pretty_print = False
+            self.handleError(record)
+
+
+class _FileQueueHandler(QueueHandler):
+    """
+    Queue handler that hands records to a file handler running on the shared
+    listener thread, so the logging call only pays for an enqueue.
+    """
+
+    def __init__(self, log_queue, target: logging.Handler):
+        """
+        Initialize the queue handler.
+
+        Args:
+            log_queue: Queue drained by the file queue listener
+            target: File handler that eventually writes the record
+        """
+        super().__init__(log_queue)
+        self.target = target
+
+    def prepare(self, record):
+        # Unlike QueueHandler.prepare, keep exc_info and extra attributes: the target
+        # formatters run on the listener thread and need them. Only the message is
+        # resolved now, so later mutation of the args cannot change what is logged.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if _file_queue_listener is None:
+            _start_file_queue_listener()
+        self.queue.put_nowait((self.target, record))
+
+    def close(self):
+        # Only flush this handler's own target: the listener is shared by every file
+        # handler, and the atexit hook stops (and drains) it before logging.shutdown()
+        # closes the file handlers
+        try:
+            self.target.flush()
+        finally:
+            super().close()
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    Queue listener that routes each record to its target handler and flushes
+    every handler once the queue has drained.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.targets: List[logging.Handler] = []
+
+    def handle(self, item):
+        target, record = item
+        if record.levelno >= target.level:
+            target.handle(record)
+
+        if self.queue.empty():
+            for handler in self.targets:
+                try:
+                    handler.flush()
+                except Exception:
+                    handler.handleError(record)
+
+    def stop(self):
+        super().stop()
+        for handler in self.targets:
+            handler.flush()
+
+
+# All file handlers share one queue and one background writer thread
+_file_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_file_queue_listener: Optional[_BatchingQueueListener] = None
+_file_queue_targets: List[logging.Handler] = []
+
+
+def _start_file_queue_listener():
+    """Start the shared file queue listener if it is not already running."""
+    global _file_queue_listener
+    with _shared_handlers_lock:
+        if _file_queue_listener is None:
+            listener = _BatchingQueueListener(_file_log_queue)
+            listener.targets = _file_queue_targets
+            listener.start()
+            _file_queue_listener = listener
+
+
+def _stop_file_queue_listener():
+    """Stop the shared file queue listener, writing out everything still queued."""
+    global _file_queue_listener
+    with _shared_handlers_lock:
+        listener, _file_queue_listener = _file_queue_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(_stop_file_queue_listener)
+
+
+def _queue_file_handler(handler: logging.Handler) -> _FileQueueHandler:
+    """
+    Route a file handler through the shared background queue.
 
-        if pretty_print:
-            return json.dumps(log_entry, indent=2)
+    Args:
+        handler: A MonthlyRotatingFileHandler or BufferedRotatingFileHandler that
+            should write (and batch its flushes) on the listener thread
+
+    Returns:
+        The QueueHandler to attach to the logger in place of the file handler
+    """
+    handler._defer_flush = True
+    with _shared_handlers_lock:
+        _file_queue_targets.append(handler)
+    _start_file_queue_listener()
+    return _FileQueueHandler(_file_log_queue, handler)
+
+
+class JSONFormatter:
+    """
+    Custom JSON formatter for structured logging.
+
+    Handlers only call ``format(record)``, so this does not inherit from
+    logging.Formatter and skips its style/datefmt setup.
+    """
+
+    def __init__(self, pretty: bool = False, binary: bool = False):
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            pretty: Whether to indent the JSON output (resolved once from config)
+            binary: Return MessagePack bytes instead of a JSON string (requires msgpack)
+        """
+        self._pretty = pretty
+        self._binary = binary
+        # Bind the serializers once so format() does not re-check the mode per record
+        if binary:
+            self._serialize = _packb
         else:
-            return json.dumps(log_entry)
+            self._serialize = functools.partial(_dumps, pretty=pretty)
+        self._serialize_bytes = functools.partial(_dumps_bytes, pretty=pretty)
+        # Per-thread entry dict, refilled for every record instead of reallocated
+        self._local = threading.local()
+
+    def _reusable_entry(self) -> Dict[str, Any]:
+        """Return this thread's entry dict, emptied and ready to be filled."""
+        log_entry = getattr(self._local, "entry", None)
+        if log_entry is None:
+            log_entry = self._local.entry = {}
+        else:
+            log_entry.clear()
+        return log_entry
+
+    def _build_entry(self, record) -> Dict[str, Any]:
+        """Fill this thread's entry dict from a log record."""
+        log_entry = self._reusable_entry()
+        log_entry["timestamp"] = _utc_timestamp(record.created)
+        log_entry["logger"] = record.name
+        log_entry["level"] = record.levelname
+        log_entry["message"] = record.getMessage()
+        log_entry["module"] = record.module
+        log_entry["function"] = record.funcName
+        log_entry["line"] = record.lineno
+
+        # Read optional attributes straight from the record dict (no hasattr/getattr)
+        attrs = record.__dict__
+
+        # Add structured data if present
+        structured_data = attrs.get("structured_data")
+        if structured_data is not None:
+            log_entry["data"] = structured_data
+
+        # Add exception info if present
+        exc_info = attrs.get("exc_info")
+        if exc_info:
+            log_entry["exception"] = self.formatException(exc_info)
+
+        return log_entry
+
+    @staticmethod
+    def formatException(exc_info) -> str:
+        """Render exception info as a traceback string."""
+        text = "".join(traceback.format_exception(*exc_info))
+        return text[:-1] if text.endswith("\n") else text
+
+    def format(self, record):
+        return self._serialize(self._build_entry(record))
+
+    def format_bytes(self, record) -> bytes:
+        """
+        Format a record straight to UTF-8 JSON bytes (JSON mode only).
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            The JSON document for the record, without a line terminator
+        """
+        return self._serialize_bytes(self._build_entry(record))
+
+
+# Format strings for the plain-text handlers, selected by the log_format setting
+_FORMATS = MappingProxyType({
+    "json": '{"timestamp": "%(asctime)s", "logger": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}',
+    "minimal": '%(levelname)s: %(message)s',
+    "standard": '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+})
+
+# Formatters hold no per-record state (JSONFormatter keeps its scratch dict per
+# thread), so every handler shares one instance per configuration.
+_standard_formatter_cache: Dict[str, logging.Formatter] = {}
+_json_formatter_cache: Dict[bool, JSONFormatter] = {}
+
+
+def _get_standard_formatter(kind: str) -> logging.Formatter:
+    """
+    Return the shared plain-text formatter for a log_format setting.
+
+    Args:
+        kind: "json", "minimal" or "standard"; anything else means "standard"
+
+    Returns:
+        A cached logging.Formatter
+    """
+    if kind not in _FORMATS:
+        kind = "standard"
+    formatter = _standard_formatter_cache.get(kind)
+    if formatter is None:
+        formatter = _standard_formatter_cache.setdefault(kind, logging.Formatter(_FORMATS[kind]))
+    return formatter
+
+
+def _get_json_formatter(pretty: bool = False) -> JSONFormatter:
+    """
+    Return the shared JSONFormatter for the given pretty-print setting.
+
+    Args:
+        pretty: Whether to indent the JSON output
+
+    Returns:
+        A cached JSONFormatter
+    """
+    pretty = bool(pretty)
+    formatter = _json_formatter_cache.get(pretty)
+    if formatter is None:
+        formatter = _json_formatter_cache.setdefault(pretty, JSONFormatter(pretty=pretty))
+    return formatter
+
+
+# Resolved logging settings, populated by the first _load_logging_config call
+_logging_config_cache: Optional[Dict[str, Any]] = None
 
 
 def _load_logging_config():
@@ -102,49 +737,108 @@ def _load_logging_config():
     Helper to load and cache logging config from app.core.config.get_config.
     Returns a dict with all needed logging config values with sensible defaults.
     """
+    global _logging_config_cache
+    if _logging_config_cache is not None:
+        return _logging_config_cache
+
     try:
         config = get_config()
         logging_cfg = getattr(config, "logging", None)
     except Exception:
         logging_cfg = None
 
-    def get_attr(obj, attr, default):
-        try:
-            return getattr(obj, attr)
-        except Exception:
-            return default
+    # One plain dict lookup per setting instead of a guarded getattr call
+    cfg_dict = getattr(logging_cfg, "__dict__", None) or {}
 
-    enable_file_logging = get_attr(logging_cfg, "enable_file_logging", True)
-    enable_json_logging = get_attr(logging_cfg, "enable_json_logging", None)
+    enable_file_logging = cfg_dict.get("enable_file_logging", True)
+    enable_json_logging = cfg_dict.get("enable_json_logging", None)
     if enable_json_logging is None:
         enable_json_logging = enable_file_logging
-    log_file_path = get_attr(logging_cfg, "log_file_path", "logs")
+    log_file_path = cfg_dict.get("log_file_path", "logs")
     # Extract directory part if path includes filename
-    log_directory = Path(log_file_path).parent if Path(log_file_path).suffix else Path(log_file_path)
-    max_file_size_mb = get_attr(logging_cfg, "log_rotation_max_size_mb", 10)
-    backup_count = get_attr(logging_cfg, "log_rotation_backup_count", 5)
-    enable_console_logging = get_attr(logging_cfg, "enable_console_logging", True)
-    log_format = get_attr(logging_cfg, "log_format", "standard")
-    log_level_operational = get_attr(logging_cfg, "log_level", "INFO")
+    log_directory = os.fspath(Path(log_file_path).parent if Path(log_file_path).suffix else Path(log_file_path))
+    max_file_size_mb = cfg_dict.get("log_rotation_max_size_mb", 10)
+    backup_count = cfg_dict.get("log_rotation_backup_count", 5)
+    compress_backups = cfg_dict.get("log_rotation_compress", False)
+    enable_console_logging = cfg_dict.get("enable_console_logging", True)
+    log_format = cfg_dict.get("log_format", "standard")
+    log_level_operational = cfg_dict.get("log_level", "INFO")
     log_level_debug = log_level_operational  # fallback to operational level
 
     # Some config keys may not exist, so provide defaults for structured and pretty print
-    enable_structured_data = True
-    json_pretty_print = False
+    enable_structured_data = cfg_dict.get("enable_structured_data", True)
+    json_pretty_print = cfg_dict.get("json_pretty_print", False)
+    enable_auto_detection_logging = cfg_dict.get("enable_auto_detection_logging", True)
+    auto_detection_log_pretty = cfg_dict.get("auto_detection_log_pretty", False)
 
-    return {
+    log_file_format = cfg_dict.get("log_file_format", "json")
+    if log_file_format == "msgpack" and msgpack is None:
+        logging.getLogger(__name__).warning(
+            "LOG_FILE_FORMAT=msgpack requires the msgpack package; writing JSON log files instead"
+        )
+        log_file_format = "json"
+
+    _logging_config_cache = {
         "enable_file_logging": enable_file_logging,
         "enable_json_logging": enable_json_logging,
         "log_directory": log_directory,
         "max_file_size_mb": max_file_size_mb,
         "backup_count": backup_count,
+        "compress_backups": compress_backups,
         "enable_console_logging": enable_console_logging,
         "log_format": log_format,
         "log_level_operational": log_level_operational,
         "log_level_debug": log_level_debug,
         "enable_structured_data": enable_structured_data,
         "json_pretty_print": json_pretty_print,
+        "enable_auto_detection_logging": enable_auto_detection_logging,
+        "auto_detection_log_pretty": auto_detection_log_pretty,
+        "log_file_format": log_file_format,
     }
+    return _logging_config_cache
+
+
+# File handlers are created once per target and attached to every logger that
+# writes there, instead of each logger opening its own descriptor on the same file.
+_handler_pool: Dict[Tuple[str, ...], logging.Handler] = {}
+_handler_pool_lock = threading.Lock()
+
+
+def _get_pooled_handler(key: Tuple[str, ...], build: Callable[[], logging.Handler]) -> logging.Handler:
+    """
+    Return the shared handler for a log target, building it on first use.
+
+    Args:
+        key: Identifies the target, e.g. ("file", "/abs/path/operational.log")
+        build: Creates the handler if none is pooled for the key yet
+
+    Returns:
+        The pooled handler
+    """
+    handler = _handler_pool.get(key)
+    if handler is None:
+        with _handler_pool_lock:
+            handler = _handler_pool.get(key)
+            if handler is None:
+                handler = _handler_pool[key] = build()
+    return handler
+
+
+def reload_logging_config() -> Dict[str, Any]:
+    """
+    Drop the cached logging settings and read them again from get_config().
+
+    Useful after set_config() or environment changes (e.g. in tests). Loggers
+    that are already configured keep their handlers; only loggers configured
+    afterwards and log_structured see the new values.
+
+    Returns:
+        The freshly loaded logging settings
+    """
+    global _logging_config_cache
+    _logging_config_cache = None
+    _logger_setup_cache.clear()
+    return _load_logging_config()
 
 
 def get_logger(name, log_category="operational"):
@@ -164,6 +858,33 @@ def get_logger(name, log_category="operational"):
     if logger.handlers:
         return logger
 
+    # Every logger of a category gets the same level and handlers, so build them once
+    setup = _logger_setup_cache.get(log_category)
+    if setup is None:
+        setup = _logger_setup_cache.setdefault(log_category, _build_logger_setup(log_category))
+    log_level, handlers = setup
+
+    logger.setLevel(log_level)
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    return logger
+
+
+# Level and handlers per log category, built by the first get_logger call for it
+_logger_setup_cache: Dict[str, Tuple[int, Tuple[logging.Handler, ...]]] = {}
+
+
+def _build_logger_setup(log_category: str) -> Tuple[int, Tuple[logging.Handler, ...]]:
+    """
+    Resolve the level and build the handlers for loggers of one category.
+
+    Args:
+        log_category: Type of logger - "operational" or "debug"
+
+    Returns:
+        The log level and the handlers to attach
+    """
     cfg = _load_logging_config()
 
     # Set log levels based on category
@@ -173,63 +894,109 @@ def get_logger(name, log_category="operational"):
         log_level_name = cfg.get("log_level_debug", "DEBUG")
 
     log_level = getattr(logging, log_level_name.upper(), logging.INFO)
-    logger.setLevel(log_level)
+    handlers: List[logging.Handler] = []
 
     # Configure standard log format
-    log_format_type = cfg.get("log_format", "standard")
-    if log_format_type == "json":
-        log_format = '{"timestamp": "%(asctime)s", "logger": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}'
-    elif log_format_type == "minimal":
-        log_format = '%(levelname)s: %(message)s'
-    else:  # standard
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-
-    standard_formatter = logging.Formatter(log_format)
-    json_formatter = JSONFormatter()
-
-    # Console handler (if enabled)
+    standard_formatter = _get_standard_formatter(cfg.get("log_format", "standard"))
+    json_formatter = _get_json_formatter(cfg.get("json_pretty_print", False))
+
+    # Console handler (if enabled) - shared across all loggers
     if cfg.get("enable_console_logging", True):
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(standard_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(_get_shared_console_handler(standard_formatter))
 
     # Create log directory if it doesn't exist
     if cfg.get("enable_file_logging", True) or cfg.get("enable_json_logging", True):
-        log_path = Path(cfg.get("log_directory", "logs"))
+        log_path = cfg.get("log_directory", "logs")
         # Ensure logs/current/, logs/archive/ directories exist
         for subdir in ["current", "archive"]:
-            (log_path / subdir).mkdir(parents=True, exist_ok=True)
-        log_path.mkdir(exist_ok=True)
+            _ensure_directory(os.path.join(log_path, subdir))
 
     # Standard file handler (if enabled)
     if cfg.get("enable_file_logging", True):
+        # Only the operational category has a plain-text log file
         if log_category == "operational":
-            log_file = log_path / "operational.log"
-        elif log_category == "debug" and False:  # No config for debug file enable, keep disabled
-            log_file = log_path / "debug.log"
-        else:
-            log_file = None
+            log_file = os.path.join(log_path, "operational.log")
+
+            def build_file_handler():
+                file_handler = BufferedRotatingFileHandler(
+                    log_file,
+                    maxBytes=cfg.get("max_file_size_mb", 10) * 1024 * 1024,
+                    backupCount=cfg.get("backup_count", 5),
+                    compress=cfg.get("compress_backups", False)
+                )
+                file_handler.setFormatter(standard_formatter)
+                return _queue_file_handler(file_handler)
 
-        if log_file:
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=cfg.get("max_file_size_mb", 10) * 1024 * 1024,
-                backupCount=cfg.get("backup_count", 5)
-            )
-            file_handler.setFormatter(standard_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(_get_pooled_handler(("file", os.path.abspath(log_file)), build_file_handler))
 
     # JSON file handler (if enabled) - Phase 2A addition with monthly rotation
     if cfg.get("enable_json_logging", True) and log_category == "operational":
-        # Use monthly rotating handler for operational logs
-        json_handler = MonthlyRotatingFileHandler(
-            base_path=log_path,
-            base_name="operational"
-        )
-        json_handler.setFormatter(json_formatter)
-        logger.addHandler(json_handler)
+        file_format = cfg.get("log_file_format", "json")
+
+        def build_json_handler():
+            # Use monthly rotating handler for operational logs
+            if file_format == "msgpack":
+                json_handler = MonthlyRotatingFileHandler(
+                    base_path=log_path,
+                    base_name="operational",
+                    extension=".mpack"
+                )
+                json_handler.setFormatter(JSONFormatter(binary=True))
+            else:
+                json_handler = MonthlyRotatingFileHandler(
+                    base_path=log_path,
+                    base_name="operational"
+                )
+                json_handler.setFormatter(json_formatter)
+            return _queue_file_handler(json_handler)
+
+        pool_key = ("operational", os.path.abspath(log_path), file_format)
+        handlers.append(_get_pooled_handler(pool_key, build_json_handler))
+
+    return log_level, tuple(handlers)
+
+
+def _has_standard_handler(logger: logging.Logger) -> bool:
+    """
+    Check whether any handler reached by this logger renders the plain message text.
+
+    Evaluated on every log_structured call rather than cached, so handlers added or
+    reformatted after the first call are taken into account; it is a few isinstance checks.
+
+    Args:
+        logger: Logger whose own and propagated handlers are inspected
+
+    Returns:
+        False only if every handler formats records as JSON
+    """
+    current = logger
+    while current:
+        for handler in current.handlers:
+            if isinstance(handler, logging.NullHandler):
+                continue
+            if isinstance(handler, _FileQueueHandler):
+                handler = handler.target
+            if not isinstance(handler.formatter, JSONFormatter):
+                return True
+        if not current.propagate:
+            break
+        current = current.parent
+    return False
+
+class _LazyKeyValues:
+    """Renders structured data as "[key=value, ...]" on first str() and caches it."""
+
+    __slots__ = ("_data", "_text")
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = f"[{', '.join(f'{k}={v}' for k, v in self._data.items())}]"
+        return self._text
 
-    return logger
 
 def log_structured(logger, level, message, **structured_data):
     """
@@ -241,151 +1008,61 @@ def log_structured(logger, level, message, **structured_data):
         message: Base log message
         **structured_data: Key-value pairs to include as structured data
     """
-    try:
-        config = get_config()
-        enable_structured = getattr(config.logging, "enable_structured_data", True)
-    except Exception:
-        enable_structured = True
+    if not logger.isEnabledFor(level):
+        return
+
+    enable_structured = _load_logging_config().get("enable_structured_data", True)
+
+    # Message for standard formatters (skipped when only JSON handlers consume it).
+    # The "[key=value, ...]" text is only rendered if a handler calls getMessage().
+    if enable_structured and structured_data and _has_standard_handler(logger):
+        msg = "%s %s"
+        args = (message, _LazyKeyValues(structured_data))
+    else:
+        msg = message
+        args = None
 
-    # Create a custom log record with structured data
-    record = logger.makeRecord(
-        logger.name, level, "(unknown file)", 0, message, (), None
+    # Build the record with its final message in one go (no extra/sinfo, so skip makeRecord)
+    record = logging.LogRecord(
+        logger.name, level, "(unknown file)", 0, msg, args, None, func=None
     )
 
     # Add structured data to the record for JSON formatter
     if structured_data:
         record.structured_data = structured_data
 
-    # Format message for standard formatters
-    if enable_structured and structured_data:
-        # Format structured data as [key=value, key=value] for standard logs
-        structured_parts = [f"{k}={v}" for k, v in structured_data.items()]
-        structured_str = "[" + ", ".join(structured_parts) + "]"
-        full_message = f"{message} {structured_str}"
-    else:
-        full_message = message
-
-    # Update the record message for standard formatters
-    record.msg = full_message
-    record.args = ()
-
     # Log the record (will be formatted differently by each handler)
-    logger.handle(record)
+    _dispatch(logger, record)
 
 
-class AutoDetectionJSONFormatter(logging.Formatter):
-    """Custom JSON formatter specifically for auto-detection logs"""
-    
-    def format(self, record):
-        # Use the auto-detection data if available, otherwise create basic structure
-        if hasattr(record, 'auto_detection_data'):
-            log_entry = record.auto_detection_data
-        else:
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "task_id": getattr(record, 'task_id', 'unknown'),
-                "task_name": getattr(record, 'task_name', 'unknown'),
-                "operation_type": getattr(record, 'operation_type', 'unknown'),
-                "message": record.getMessage()
-            }
-        
-        # Check if pretty formatting is enabled
-        try:
-            config = get_config()
-            pretty_format = getattr(config.logging, "auto_detection_log_pretty", False)
-        except Exception:
-            pretty_format = False
-        
-        if pretty_format:
-            return json.dumps(log_entry, indent=2)
-        else:
-            return json.dumps(log_entry)
-
-
-def get_auto_detection_logger() -> logging.Logger:
+def _dispatch(logger: logging.Logger, record: logging.LogRecord):
     """
-    Get or create the auto-detection logger for tracking auto-detection events and analytics.
+    Hand a prebuilt record to the logger's handlers.
 
-    Returns:
-        Logger instance configured for auto-detection logging
-    """
-    logger_name = "auto_detection"
-    logger = logging.getLogger(logger_name)
+    Logger.handle only adds the disabled flag and filter checks on top of
+    callHandlers, so go straight to callHandlers when neither applies.
 
-    # Return existing logger if already configured
-    if logger.handlers:
-        return logger
-
-    try:
-        config = get_config()
-        enable_auto_detection_logging = getattr(config, "enable_auto_detection_logging", True)
-        log_directory = getattr(config.logging, "log_file_path", "logs")
-    except Exception:
-        enable_auto_detection_logging = True
-        log_directory = "logs"
-
-    if not enable_auto_detection_logging:
-        # Return a no-op logger if auto-detection logging is disabled
-        logger.addHandler(logging.NullHandler())
-        return logger
-
-    logger.setLevel(logging.INFO)
-
-    # Create log directory if it doesn't exist
-    Path(log_directory).mkdir(parents=True, exist_ok=True)
+    Args:
+        logger: Logger the record belongs to
+        record: The record to emit
+    """
+    if logger.filters or logger.disabled:
+        logger.handle(record)
+    else:
+        logger.callHandlers(record)
 
-    # JSON file handler for auto-detection events with monthly rotation
-    json_handler = MonthlyRotatingFileHandler(
-        base_path=log_directory,
-        base_name="auto_detection"
-    )
-    json_handler.setFormatter(AutoDetectionJSONFormatter())
-    logger.addHandler(json_handler)
 
-    return logger
+# Auto-detection logging lives in app.core.logging_autodetect and is only imported
+# the first time one of these names is accessed (PEP 562).
+_AUTODETECT_EXPORTS = frozenset({
+    "AutoDetectionJSONFormatter",
+    "get_auto_detection_logger",
+    "log_auto_detection_event",
+})
 
 
-def log_auto_detection_event(
-    task_id: str,
-    task_name: str,
-    operation_type: str,
-    model: str,
-    duration_seconds: float,
-    auto_detection_results: Dict[str, Any],
-    performance_impact: Optional[Dict[str, Any]] = None
-):
-    """
-    Log an auto-detection event with comprehensive analytics data.
-    
-    Args:
-        task_id: Unique task identifier for correlation with cost logs
-        task_name: Human-readable task description
-        operation_type: Type of operation (code_with_ai, code_with_multiple_ai)
-        model: AI model used for the operation
-        duration_seconds: Total operation duration
-        auto_detection_results: Results of auto-detection analysis
-        performance_impact: Optional performance metrics
-    """
-    logger = get_auto_detection_logger()
-    
-    # Construct the complete auto-detection log entry
-    log_entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "task_id": task_id,
-        "task_name": task_name,
-        "operation_type": operation_type,
-        "model": model,
-        "duration_seconds": duration_seconds,
-        "auto_detection_results": auto_detection_results,
-        "performance_impact": performance_impact or {}
-    }
-    
-    # Create a custom log record with the auto-detection data
-    record = logger.makeRecord(
-        logger.name, logging.INFO, "(auto_detection)", 0, 
-        f"Auto-detection event: {task_name}", (), None
-    )
-    record.auto_detection_data = log_entry
-    
-    # Log the record
-    logger.handle(record)
+def __getattr__(name):
+    if name in _AUTODETECT_EXPORTS:
+        from app.core import logging_autodetect
+        return getattr(logging_autodetect, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,131 @@
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from app.core.logging import (
+    JSONFormatter,
+    MonthlyRotatingFileHandler,
+    _dispatch,
+    _ensure_directory,
+    _load_logging_config,
+    _queue_file_handler,
+    _utc_timestamp,
+)
+
+
+class AutoDetectionJSONFormatter(JSONFormatter):
+    """Custom JSON formatter specifically for auto-detection logs"""
+
+    def _build_entry(self, record) -> Dict[str, Any]:
+        # Use the auto-detection data if available, otherwise create basic structure
+        attrs = record.__dict__
+        auto_detection_data = attrs.get("auto_detection_data")
+        if auto_detection_data is not None:
+            return auto_detection_data
+
+        log_entry = self._reusable_entry()
+        log_entry["timestamp"] = _utc_timestamp(record.created)
+        log_entry["task_id"] = attrs.get("task_id", "unknown")
+        log_entry["task_name"] = attrs.get("task_name", "unknown")
+        log_entry["operation_type"] = attrs.get("operation_type", "unknown")
+        log_entry["message"] = record.getMessage()
+        return log_entry
+
+
+def get_auto_detection_logger() -> logging.Logger:
+    """
+    Get or create the auto-detection logger for tracking auto-detection events and analytics.
+
+    Returns:
+        Logger instance configured for auto-detection logging
+    """
+    logger_name = "auto_detection"
+    logger = logging.getLogger(logger_name)
+
+    # Return existing logger if already configured
+    if logger.handlers:
+        return logger
+
+    cfg = _load_logging_config()
+    enable_auto_detection_logging = cfg.get("enable_auto_detection_logging", True)
+    log_directory = cfg.get("log_directory", "logs")
+
+    if not enable_auto_detection_logging:
+        # Return a no-op logger if auto-detection logging is disabled
+        logger.addHandler(logging.NullHandler())
+        logger._is_active = False
+        return logger
+
+    logger.setLevel(logging.INFO)
+    logger._is_active = True
+
+    # Create log directory if it doesn't exist
+    _ensure_directory(log_directory)
+
+    # JSON file handler for auto-detection events with monthly rotation
+    if cfg.get("log_file_format", "json") == "msgpack":
+        json_handler = MonthlyRotatingFileHandler(
+            base_path=log_directory,
+            base_name="auto_detection",
+            extension=".mpack"
+        )
+        json_handler.setFormatter(AutoDetectionJSONFormatter(binary=True))
+    else:
+        json_handler = MonthlyRotatingFileHandler(
+            base_path=log_directory,
+            base_name="auto_detection"
+        )
+        json_handler.setFormatter(AutoDetectionJSONFormatter(pretty=cfg.get("auto_detection_log_pretty", False)))
+    logger.addHandler(_queue_file_handler(json_handler))
+
+    return logger
+
+
+def log_auto_detection_event(
+    task_id: str,
+    task_name: str,
+    operation_type: str,
+    model: str,
+    duration_seconds: float,
+    auto_detection_results: Dict[str, Any],
+    performance_impact: Optional[Dict[str, Any]] = None
+):
+    """
+    Log an auto-detection event with comprehensive analytics data.
+    
+    Args:
+        task_id: Unique task identifier for correlation with cost logs
+        task_name: Human-readable task description
+        operation_type: Type of operation (code_with_ai, code_with_multiple_ai)
+        model: AI model used for the operation
+        duration_seconds: Total operation duration
+        auto_detection_results: Results of auto-detection analysis
+        performance_impact: Optional performance metrics
+    """
+    logger = get_auto_detection_logger()
+
+    # Nothing would be written, so don't build the entry at all
+    if not getattr(logger, "_is_active", True) or not logger.isEnabledFor(logging.INFO):
+        return
+
+    # Construct the complete auto-detection log entry
+    log_entry = {
+        "timestamp": _utc_timestamp(time.time()),
+        "task_id": task_id,
+        "task_name": task_name,
+        "operation_type": operation_type,
+        "model": model,
+        "duration_seconds": duration_seconds,
+        "auto_detection_results": auto_detection_results,
+        "performance_impact": performance_impact or {}
+    }
+    
+    # Create a custom log record with the auto-detection data
+    record = logging.LogRecord(
+        logger.name, logging.INFO, "(auto_detection)", 0,
+        f"Auto-detection event: {task_name}", (), None, func=None
+    )
+    record.auto_detection_data = log_entry
+
+    # Log the record
+    _dispatch(logger, record)
@@ -1,10 +1,45 @@
+import atexit
 import threading
-import queue
 import time
 import logging
 import psutil
+import sched
+import math
+from array import array
 from collections import deque
-from typing import Callable, Any, Optional, Dict, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Any, Optional, Dict, Set, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Windows at least this large are rescanned with numpy (when installed); smaller ones
+# are cheaper in plain Python than numpy's per-call overhead
+_NUMPY_MIN_WINDOW = 1000
+
+# Defaults used when the resilience config is unavailable: every feature disabled
+class DummyResilienceConfig:
+    heartbeat_enabled = False
+    heartbeat_interval_seconds = 60
+    heartbeat_timeout_seconds = 180
+    resource_monitoring_enabled = False
+    resource_monitoring_interval_seconds = 30
+    max_memory_percent = 80
+    max_cpu_percent = 90
+    degraded_mode_threshold = 70
+    task_queue_enabled = False
+    max_concurrent_tasks = 5
+    queue_timeout_seconds = 10
+    enable_circuit_breaker = False
+    circuit_breaker_max_failures = 3
+    circuit_breaker_reset_time_sec = 300
+    enable_auto_recovery = False
+    auto_recovery_initial_delay_sec = 60
+    performance_metrics_enabled = False
+    performance_window_size = 100
+
 
 # Assume get_logger is available or define a simple one for standalone
 try:
@@ -16,27 +51,6 @@ except ImportError:
     def get_logger(name, log_category="operational"):
         return logging.getLogger(name)
     
-    # Dummy Config for fallback
-    class DummyResilienceConfig:
-        heartbeat_enabled = False
-        heartbeat_interval_seconds = 60
-        heartbeat_timeout_seconds = 180
-        resource_monitoring_enabled = False
-        resource_monitoring_interval_seconds = 30
-        max_memory_percent = 80
-        max_cpu_percent = 90
-        degraded_mode_threshold = 70
-        task_queue_enabled = False
-        max_concurrent_tasks = 5
-        queue_timeout_seconds = 10
-        enable_circuit_breaker = False
-        circuit_breaker_max_failures = 3
-        circuit_breaker_reset_time_sec = 300
-        enable_auto_recovery = False
-        auto_recovery_initial_delay_sec = 60
-        performance_metrics_enabled = False
-        performance_window_size = 100
-
     class DummyConfig:
         resilience = DummyResilienceConfig()
 
@@ -46,101 +60,128 @@ except ImportError:
 
 logger = get_logger("resilience_manager", "operational")
 
-class ConnectionHealthMonitor(threading.Thread):
+class ConnectionHealthMonitor:
     """
     Monitors the health of external connections by periodically sending heartbeats.
+
+    Has no thread of its own: the shared ResilienceScheduler calls tick() every interval.
     """
+    __slots__ = ("send_heartbeat", "interval", "timeout", "logger", "last_heartbeat", "healthy")
     def __init__(self, send_heartbeat: Callable[[], bool], interval: int, timeout: int, logger: logging.Logger):
-        super().__init__(daemon=True)
         self.send_heartbeat = send_heartbeat
         self.interval = interval
         self.timeout = timeout
         self.logger = logger
-        self.last_heartbeat = time.time()
-        self.running = True
+        self.last_heartbeat = time.monotonic() # Monotonic: immune to wall-clock jumps
         self.healthy = True # Initial state is healthy
 
-    def run(self):
-        self.logger.info("ConnectionHealthMonitor started.")
-        while self.running:
-            time.sleep(self.interval)
-            try:
-                # Attempt to send a heartbeat
-                if not self.send_heartbeat():
-                    self.logger.warning("Heartbeat failed. Connection might be unhealthy.")
-                    if self.healthy: # Log state change only
-                        self.healthy = False
-                else:
-                    self.last_heartbeat = time.time()
-                    if not self.healthy: # Log state change only
-                        self.logger.info("Heartbeat successful. Connection restored.")
-                        self.healthy = True
-
-                # Check for timeout
-                if time.time() - self.last_heartbeat > self.timeout:
-                    if self.healthy: # Log state change only
-                        self.logger.error(f"No successful heartbeat for {self.timeout} seconds. Connection considered unhealthy.")
-                        self.healthy = False
-            except Exception as e:
-                self.logger.error(f"Error in ConnectionHealthMonitor: {e}")
-                if self.healthy: # Log state change only
-                    self.healthy = False
+    def tick(self):
+        """Runs one heartbeat check."""
+        try:
+            # Attempt to send a heartbeat
+            if self.send_heartbeat():
+                self.last_heartbeat = time.monotonic()
+                self._set_healthy(True, logging.INFO, "Heartbeat successful. Connection restored.")
+            else:
+                self.logger.warning("Heartbeat failed. Connection might be unhealthy.")
+                self._set_healthy(False)
+
+            # Check for timeout
+            if time.monotonic() - self.last_heartbeat > self.timeout:
+                self._set_healthy(False, logging.ERROR, f"No successful heartbeat for {self.timeout} seconds. Connection considered unhealthy.")
+        except Exception as e:
+            self.logger.error("Error in ConnectionHealthMonitor: %s", e)
+            self._set_healthy(False)
+
+    def _set_healthy(self, healthy: bool, level: int = logging.INFO, reason: Optional[str] = None):
+        """Updates the health flag, logging reason at level only when the state actually changes."""
+        if self.healthy == healthy:
+            return
+        self.healthy = healthy
+        if reason:
+            self.logger.log(level, reason)
 
     def stop(self):
-        self.running = False
         self.logger.info("ConnectionHealthMonitor stopped.")
 
     def is_healthy(self) -> bool:
         """Returns True if the connection is currently considered healthy."""
         return self.healthy
 
-class ResourceManager(threading.Thread):
+class ResourceManager:
     """
     Monitors system CPU and memory usage and reports degraded or critical states.
+
+    Has no thread of its own: the shared ResilienceScheduler calls tick() every
+    resource_monitoring_interval_seconds.
     """
+    __slots__ = (
+        "config", "max_memory_percent", "max_cpu_percent", "degraded_mode_threshold", "logger",
+        "_current_memory_percent", "_current_cpu_percent", "_is_degraded", "_status_bits",
+    )
+    # Status bitmask: memory/CPU at or above the degraded threshold, then above the critical maximum
+    _MEMORY_DEGRADED = 1
+    _CPU_DEGRADED = 2
+    _MEMORY_CRITICAL = 4
+    _CPU_CRITICAL = 8
+    _DEGRADED_BITS = _MEMORY_DEGRADED | _CPU_DEGRADED
+
     def __init__(self, resilience_config: Any, logger: logging.Logger):
-        super().__init__(daemon=True)
         self.config = resilience_config # This is the config.resilience object
         self.max_memory_percent = self.config.max_memory_percent
         self.max_cpu_percent = self.config.max_cpu_percent
         self.degraded_mode_threshold = self.config.degraded_mode_threshold
         self.logger = logger
-        self.running = True
         self._current_memory_percent = 0.0
         self._current_cpu_percent = 0.0
         self._is_degraded = False
+        self._status_bits = 0
+        # Prime the CPU counter: non-blocking cpu_percent() reports usage since the previous call
+        psutil.cpu_percent(interval=None)
 
-    def run(self):
-        self.logger.info("ResourceManager started.")
-        while self.running:
-            try:
-                self._current_memory_percent = psutil.virtual_memory().percent
-                # psutil.cpu_percent blocks for 'interval' seconds to get a meaningful average
-                self._current_cpu_percent = psutil.cpu_percent(interval=1)
-                
-                mem_degraded = self._current_memory_percent >= self.degraded_mode_threshold
-                cpu_degraded = self._current_cpu_percent >= self.degraded_mode_threshold
-
-                new_degraded_status = mem_degraded or cpu_degraded
-
-                if new_degraded_status and not self._is_degraded:
-                    self.logger.warning(f"System entering degraded mode: Memory {self._current_memory_percent:.1f}% (>{self.degraded_mode_threshold}%), CPU {self._current_cpu_percent:.1f}% (>{self.degraded_mode_threshold}%)")
-                elif not new_degraded_status and self._is_degraded:
-                    self.logger.info("System exiting degraded mode.")
-                
-                self._is_degraded = new_degraded_status
-
-                if self._current_memory_percent >= self.max_memory_percent:
-                    self.logger.critical(f"Memory usage critical: {self._current_memory_percent:.1f}% (>{self.max_memory_percent}%). Consider restarting.")
-                if self._current_cpu_percent >= self.max_cpu_percent:
-                    self.logger.critical(f"CPU usage critical: {self._current_cpu_percent:.1f}% (>{self.max_cpu_percent}%).")
+    def tick(self):
+        """Samples memory/CPU once."""
+        try:
+            self._current_memory_percent = psutil.virtual_memory().percent
+            # Average CPU usage since the last tick, without blocking the thread
+            self._current_cpu_percent = psutil.cpu_percent(interval=None)
+            
+            memory = self._current_memory_percent
+            cpu = self._current_cpu_percent
+            threshold = self.degraded_mode_threshold
+            status_bits = (
+                (memory >= threshold)
+                | ((cpu >= threshold) << 1)
+                | ((memory >= self.max_memory_percent) << 2)
+                | ((cpu >= self.max_cpu_percent) << 3)
+            )
+            # Quiet ticks (status unchanged) do no logging work at all
+            if status_bits != self._status_bits:
+                self._report_status_change(self._status_bits, status_bits)
+                self._status_bits = status_bits
+                self._is_degraded = bool(status_bits & self._DEGRADED_BITS)
 
-            except Exception as e:
-                self.logger.error(f"Error in ResourceManager: {e}")
-            time.sleep(self.config.resource_monitoring_interval_seconds)
+        except Exception as e:
+            self.logger.error("Error in ResourceManager: %s", e)
+
+    def _report_status_change(self, old_bits: int, new_bits: int):
+        """Logs degraded-mode and critical-usage transitions between two status bitmasks."""
+        memory = self._current_memory_percent
+        cpu = self._current_cpu_percent
+        was_degraded = bool(old_bits & self._DEGRADED_BITS)
+        now_degraded = bool(new_bits & self._DEGRADED_BITS)
+        if now_degraded and not was_degraded:
+            self.logger.warning(f"System entering degraded mode: Memory {memory:.1f}% (>{self.degraded_mode_threshold}%), CPU {cpu:.1f}% (>{self.degraded_mode_threshold}%)")
+        elif was_degraded and not now_degraded:
+            self.logger.info("System exiting degraded mode.")
+
+        raised = new_bits & ~old_bits
+        if raised & self._MEMORY_CRITICAL:
+            self.logger.critical(f"Memory usage critical: {memory:.1f}% (>{self.max_memory_percent}%). Consider restarting.")
+        if raised & self._CPU_CRITICAL:
+            self.logger.critical(f"CPU usage critical: {cpu:.1f}% (>{self.max_cpu_percent}%).")
 
     def stop(self):
-        self.running = False
         self.logger.info("ResourceManager stopped.")
 
     def is_degraded(self) -> bool:
@@ -148,7 +189,12 @@ class ResourceManager(threading.Thread):
         return self._is_degraded
 
     def get_metrics(self) -> Dict[str, float]:
-        """Returns current memory and CPU usage percentages."""
+        """
+        Returns current memory and CPU usage percentages.
+
+        These are the values sampled on the last tick, refreshed every
+        resource_monitoring_interval_seconds rather than on each call.
+        """
         return {
             "memory_percent": self._current_memory_percent,
             "cpu_percent": self._current_cpu_percent,
@@ -159,38 +205,53 @@ class TaskQueueManager:
     """
     Manages a task queue and tracks active tasks to enforce concurrency limits.
     """
+    __slots__ = (
+        "max_concurrent_tasks", "logger", "active_tasks", "queue_timeout",
+        "_slots", "_active_tasks_lock", "_executor",
+    )
     def __init__(self, max_concurrent_tasks: int, logger: logging.Logger, queue_timeout: int = 10):
         self.max_concurrent_tasks = max_concurrent_tasks
         self.logger = logger
-        self.task_queue = queue.Queue() # This queue is for internal worker management if needed
         self.active_tasks = 0
         self.queue_timeout = queue_timeout
-        self._active_tasks_lock = threading.Lock()
+        # Concurrency slots: rejecting a task when all are taken needs no lock
+        self._slots = threading.BoundedSemaphore(max_concurrent_tasks)
+        self._active_tasks_lock = threading.Lock() # Guards only the active_tasks counter
+        self._executor: Optional[ThreadPoolExecutor] = None # Created by start_workers() or the first submit()
 
-    def submit(self, func: Callable, *args, **kwargs):
-        """Submits a task to the internal queue (if workers are managed by this class)."""
-        self.task_queue.put((func, args, kwargs))
-        self.logger.debug(f"Task submitted to internal queue. Queue size: {self.task_queue.qsize()}")
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Runs a task on the worker pool (sized max_concurrent_tasks unless start_workers() chose otherwise).
+        Returns a Future so callers can observe the result or exception.
+        """
+        future = self._get_executor(self.max_concurrent_tasks).submit(func, *args, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Task submitted to worker pool: %s", getattr(func, "__name__", func))
+        return future
 
     def enqueue_task(self, task_id: Any) -> bool:
         """
         Attempts to 'enqueue' a task by incrementing the active task count.
         Returns True if successful, False if max_concurrent_tasks is reached.
         """
+        if not self._slots.acquire(blocking=False):
+            self.logger.warning("Task queue full. Max concurrent tasks (%d) reached. Task %s rejected.", self.max_concurrent_tasks, task_id)
+            return False
         with self._active_tasks_lock:
-            if self.active_tasks >= self.max_concurrent_tasks:
-                self.logger.warning(f"Task queue full. Max concurrent tasks ({self.max_concurrent_tasks}) reached. Task {task_id} rejected.")
-                return False
             self.active_tasks += 1
-            self.logger.debug(f"Task {task_id} enqueued. Active tasks: {self.active_tasks}")
-            return True
+            active_tasks = self.active_tasks
+        self.logger.debug("Task %s enqueued. Active tasks: %d", task_id, active_tasks)
+        return True
 
     def dequeue_task(self) -> None:
         """Decrements the active task count."""
         with self._active_tasks_lock:
-            if self.active_tasks > 0:
-                self.active_tasks -= 1
-                self.logger.debug(f"Task dequeued. Active tasks: {self.active_tasks}")
+            if self.active_tasks <= 0:
+                return
+            self.active_tasks -= 1
+            active_tasks = self.active_tasks
+        self._slots.release()
+        self.logger.debug("Task dequeued. Active tasks: %d", active_tasks)
 
     def get_active_tasks_count(self) -> int:
         """Returns the current number of active tasks."""
@@ -198,35 +259,33 @@ class TaskQueueManager:
             return self.active_tasks
 
     def start_workers(self, num_workers: int):
-        """Starts worker threads to process tasks from the internal queue."""
-        self.logger.info(f"Starting {num_workers} task queue workers.")
-        for _ in range(num_workers):
-            worker = threading.Thread(target=self._worker_loop, daemon=True)
-            worker.start()
-
-    def _worker_loop(self):
-        """Worker loop to fetch and execute tasks from the queue."""
-        while True:
-            try:
-                func, args, kwargs = self.task_queue.get(timeout=self.queue_timeout)
-                self.logger.debug(f"Worker processing task: {func.__name__}")
-                try:
-                    func(*args, **kwargs)
-                except Exception as e:
-                    self.logger.error(f"Error processing task in worker: {e}")
-                finally:
-                    self.task_queue.task_done()
-            except queue.Empty:
-                self.logger.debug("Task queue empty, worker waiting...")
-                time.sleep(1) # Wait a bit before checking again
-            except Exception as e:
-                self.logger.critical(f"Critical error in task queue worker: {e}")
+        """Creates the worker pool that runs submitted tasks (no-op if it already exists)."""
+        self._get_executor(num_workers)
+
+    def _get_executor(self, num_workers: int) -> ThreadPoolExecutor:
+        """Returns the worker pool, creating it with num_workers threads on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._active_tasks_lock:
+                executor = self._executor
+                if executor is None:
+                    self.logger.info(f"Starting {num_workers} task queue workers.")
+                    executor = self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="taskq")
+        return executor
+
+    def stop_workers(self):
+        """Shuts down the worker pool without waiting for queued tasks to finish."""
+        executor = self._executor
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=False)
 
 class CircuitBreaker:
     """
     Implements the Circuit Breaker pattern to prevent repeated failures against a service.
     States: CLOSED, OPEN, HALF-OPEN.
     """
+    __slots__ = ("threshold", "reset_time", "logger", "failures", "last_failure_time", "state", "_lock")
     CLOSED = "CLOSED"
     OPEN = "OPEN"
     HALF_OPEN = "HALF-OPEN"
@@ -236,7 +295,7 @@ class CircuitBreaker:
         self.reset_time = reset_time # Time in seconds to wait before attempting to close
         self.logger = logger
         self.failures = 0
-        self.last_failure_time = None
+        self.last_failure_time = None # time.monotonic() of the last failure
         self.state = self.CLOSED
         self._lock = threading.Lock()
 
@@ -246,47 +305,62 @@ class CircuitBreaker:
         Raises CircuitBreakerOpenException if the circuit is open.
         Raises CircuitBreakerTrippedException if the call fails and trips the circuit.
         """
-        with self._lock:
-            if self.state == self.OPEN:
-                if time.time() - self.last_failure_time > self.reset_time:
-                    self.state = self.HALF_OPEN
-                    self.logger.info("Circuit Breaker: State changed to HALF-OPEN (reset time elapsed).")
+        # Fast path: a CLOSED breaker needs no lock before the call (attribute reads are atomic).
+        # Logging always happens after the lock is released, so slow handlers never extend it.
+        if self.state != self.CLOSED:
+            with self._lock:
+                state = self.state
+                if state == self.OPEN and time.monotonic() - self.last_failure_time > self.reset_time:
+                    state = self.state = self.HALF_OPEN
+                    message = "Circuit Breaker: State changed to HALF-OPEN (reset time elapsed)."
+                elif state == self.HALF_OPEN:
+                    message = "Circuit Breaker: HALF-OPEN. Allowing one test call."
                 else:
-                    self.logger.warning("Circuit Breaker: OPEN. Call rejected.")
-                    raise CircuitBreakerOpenException("Circuit breaker is OPEN. Calls are being rejected.")
-            elif self.state == self.HALF_OPEN:
-                self.logger.info("Circuit Breaker: HALF-OPEN. Allowing one test call.")
+                    message = None
+            if state == self.OPEN:
+                self.logger.warning("Circuit Breaker: OPEN. Call rejected.")
+                raise CircuitBreakerOpenException("Circuit breaker is OPEN. Calls are being rejected.")
+            if message:
+                self.logger.info(message)
 
         try:
             result = func(*args, **kwargs)
-            with self._lock:
-                if self.state == self.HALF_OPEN:
-                    self.state = self.CLOSED
-                    self.failures = 0
-                    self.logger.info("Circuit Breaker: State changed to CLOSED (successful call in HALF-OPEN).")
-                elif self.state == self.CLOSED:
-                    self.failures = 0 # Reset failures on success in CLOSED state
-            return result
         except Exception as e:
             with self._lock:
                 self.failures += 1
-                self.last_failure_time = time.time()
-                self.logger.error(f"Circuit Breaker: Call failed. Failures: {self.failures}/{self.threshold}. Error: {e}")
-                if self.failures >= self.threshold and self.state == self.CLOSED:
+                self.last_failure_time = time.monotonic()
+                failures = self.failures
+                if failures >= self.threshold and self.state == self.CLOSED:
                     self.state = self.OPEN
-                    self.logger.error("Circuit Breaker: State changed to OPEN (too many failures).")
+                    transition = "Circuit Breaker: State changed to OPEN (too many failures)."
                 elif self.state == self.HALF_OPEN:
                     self.state = self.OPEN
-                    self.logger.error("Circuit Breaker: State changed back to OPEN (failure in HALF-OPEN).")
+                    transition = "Circuit Breaker: State changed back to OPEN (failure in HALF-OPEN)."
+                else:
+                    transition = None
+            self.logger.error("Circuit Breaker: Call failed. Failures: %d/%d. Error: %s", failures, self.threshold, e)
+            if transition:
+                self.logger.error(transition)
             raise CircuitBreakerTrippedException(f"Circuit breaker tripped due to failure: {e}") from e
 
+        # Only lock when there is something to reset
+        if self.state != self.CLOSED or self.failures:
+            with self._lock:
+                closed = self.state == self.HALF_OPEN
+                if closed or self.state == self.CLOSED:
+                    self.state = self.CLOSED
+                    self.failures = 0 # Reset failures on success
+            if closed:
+                self.logger.info("Circuit Breaker: State changed to CLOSED (successful call in HALF-OPEN).")
+        return result
+
     def reset(self):
         """Manually resets the circuit breaker to the CLOSED state."""
         with self._lock:
             self.failures = 0
             self.state = self.CLOSED
             self.last_failure_time = None
-            self.logger.info("Circuit Breaker: Manually reset to CLOSED state.")
+        self.logger.info("Circuit Breaker: Manually reset to CLOSED state.")
 
 class CircuitBreakerOpenException(Exception):
     """Exception raised when the circuit breaker is open and rejects a call."""
@@ -300,114 +374,208 @@ class AutoRecoverySystem:
     """
     Attempts to automatically recover from connection or service failures by
     periodically calling a reconnect function.
+
+    Has no thread of its own: the shared ResilienceScheduler calls tick() every interval.
     """
+    __slots__ = ("reconnect_func", "interval", "logger")
     def __init__(self, reconnect_func: Callable[[], bool], interval: int, logger: logging.Logger):
         self.reconnect_func = reconnect_func
         self.interval = interval
         self.logger = logger
-        self.running = True
-        self._recovery_thread = None
-
-    def start(self):
-        """Starts the auto-recovery thread."""
-        if self._recovery_thread is None or not self._recovery_thread.is_alive():
-            self.running = True
-            self._recovery_thread = threading.Thread(target=self._recovery_loop, daemon=True)
-            self._recovery_thread.start()
-            self.logger.info("AutoRecoverySystem started.")
-
-    def _recovery_loop(self):
-        """The main loop for the auto-recovery thread."""
-        while self.running:
-            time.sleep(self.interval)
-            try:
-                self.logger.info("AutoRecovery: Attempting to reconnect...")
-                if not self.reconnect_func():
-                    self.logger.warning("AutoRecovery: Reconnect attempt failed. Retrying later.")
-                else:
-                    self.logger.info("AutoRecovery: Reconnect successful.")
-            except Exception as e:
-                self.logger.error(f"Error during auto-recovery attempt: {e}")
+
+    def tick(self):
+        """Makes one reconnect attempt."""
+        try:
+            self.logger.info("AutoRecovery: Attempting to reconnect...")
+            if not self.reconnect_func():
+                self.logger.warning("AutoRecovery: Reconnect attempt failed. Retrying later.")
+            else:
+                self.logger.info("AutoRecovery: Reconnect successful.")
+        except Exception as e:
+            self.logger.error("Error during auto-recovery attempt: %s", e)
 
     def stop(self):
-        """Stops the auto-recovery thread."""
-        self.running = False
-        if self._recovery_thread and self._recovery_thread.is_alive():
-            self._recovery_thread.join(timeout=self.interval + 1) # Give it a moment to finish
+        """Marks auto-recovery as stopped (its tick is cancelled with the scheduler)."""
         self.logger.info("AutoRecoverySystem stopped.")
 
-class PerformanceMetrics(threading.Thread):
+class PerformanceMetrics:
     """
     Collects and provides summary statistics for task durations over a sliding window.
+    The periodic summary is driven by tick() on the shared ResilienceScheduler.
     """
+    __slots__ = (
+        "window", "logger", "_pending", "_durations", "_head", "_count", "_metrics_lock",
+        "_sum", "_min", "_max", "_extremes_stale",
+    )
+    SUMMARY_INTERVAL_SECONDS = 30
     def __init__(self, window: int, logger: logging.Logger):
-        super().__init__(daemon=True)
         self.window = window # Max number of metrics to store
         self.logger = logger
-        self.metrics = deque(maxlen=window) # Stores (timestamp, duration)
-        self.running = True
+        # Recorded but not yet summarized samples. deque.append is atomic, so recording takes
+        # no lock; anything beyond the last window samples would be evicted anyway, hence maxlen
+        self._pending = deque(maxlen=window)
+        # Ring buffer of durations as a flat float array: no per-sample tuple or float objects
+        self._durations = array("d", bytes(8 * window))
+        self._head = 0 # Next slot to write
+        self._count = 0 # Number of valid samples (at most window)
         self._metrics_lock = threading.Lock()
+        # Running aggregates over the window, updated as samples enter and leave the window
+        self._sum = 0.0
+        self._min = 0.0
+        self._max = 0.0
+        self._extremes_stale = False # Set when an evicted sample was the current min or max
 
-    def run(self):
-        self.logger.info("PerformanceMetrics monitor started.")
-        while self.running:
-            time.sleep(30) # Periodically log summary
-            self.get_latest() # Triggers logging of current stats
-        self.logger.info("PerformanceMetrics monitor stopped.")
+    def tick(self):
+        """Computes (and debug-logs) the current summary (called by the shared ResilienceScheduler)."""
+        self.get_latest()
 
-    def record_metric(self, duration: float):
-        """Records a single task duration metric."""
-        with self._metrics_lock:
-            self.metrics.append((time.time(), duration))
-            self.logger.debug(f"Recorded performance metric: {duration:.2f}s. Total metrics: {len(self.metrics)}")
+    def record_metric(self, duration: float, trace: bool = False):
+        """
+        Records a single task duration metric.
+
+        Samples are summarized periodically by tick(); pass trace=True to also
+        debug-log this individual sample.
+        """
+        self._pending.append(duration)
+        if trace and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Recorded performance metric: %.2fs. Total metrics: %d",
+                duration, min(self._count + len(self._pending), self.window),
+            )
+
+    def _drain_pending(self):
+        """Moves pending samples into the ring buffer and running aggregates. Caller holds _metrics_lock."""
+        window = self.window
+        pending = self._pending
+        while pending:
+            duration = pending.popleft()
+            head = self._head
+            if self._count == window:
+                # Overwriting the oldest sample
+                evicted = self._durations[head]
+                self._sum -= evicted
+                if evicted == self._min or evicted == self._max:
+                    self._extremes_stale = True
+            else:
+                self._count += 1
+            if self._count == 1:
+                self._min = self._max = duration
+            else:
+                if duration < self._min:
+                    self._min = duration
+                if duration > self._max:
+                    self._max = duration
+            self._durations[head] = duration
+            self._head = head + 1 if head + 1 < window else 0
+            self._sum += duration
 
     def get_latest(self) -> Dict[str, Any]:
         """Returns a summary of performance metrics (count, average, min, max duration)."""
         with self._metrics_lock:
-            if not self.metrics:
+            self._drain_pending()
+            count = self._count
+            if not count:
                 return {"count": 0, "avg_duration_seconds": 0, "min_duration_seconds": 0, "max_duration_seconds": 0, "window_size": self.window}
 
-            durations = [m[1] for m in self.metrics]
-            avg_duration = sum(durations) / len(durations)
-            min_duration = min(durations)
-            max_duration = max(durations)
+            if self._extremes_stale:
+                # Rescan only after the min or max left the window (also drops float drift from _sum)
+                if numpy is not None and count >= _NUMPY_MIN_WINDOW:
+                    durations = numpy.frombuffer(self._durations, dtype=numpy.float64, count=count)
+                    self._sum = float(durations.sum())
+                    self._min = float(durations.min())
+                    self._max = float(durations.max())
+                else:
+                    durations = self._durations[:count]
+                    self._sum = math.fsum(durations)
+                    self._min = min(durations)
+                    self._max = max(durations)
+                self._extremes_stale = False
 
             metrics_summary = {
-                "count": len(durations),
-                "avg_duration_seconds": avg_duration,
-                "min_duration_seconds": min_duration,
-                "max_duration_seconds": max_duration,
+                "count": count,
+                "avg_duration_seconds": self._sum / count,
+                "min_duration_seconds": self._min,
+                "max_duration_seconds": self._max,
                 "window_size": self.window
             }
-            self.logger.debug(f"Current performance metrics: {metrics_summary}")
-            return metrics_summary
+        self.logger.debug("Current performance metrics: %s", metrics_summary)
+        return metrics_summary
 
     def stop(self):
-        """Stops the performance metrics monitoring thread."""
-        self.running = False
+        """Marks the performance metrics monitor as stopped (its tick is cancelled with the scheduler)."""
         self.logger.info("PerformanceMetrics monitor stopped.")
 
 
+class ResilienceScheduler(threading.Thread):
+    """
+    Runs the periodic tick() of every resilience monitor on a single thread.
+
+    Checks run one at a time, so a slow check delays the next one instead of
+    needing a thread of its own.
+    """
+    __slots__ = ("logger", "_stop_event", "_stop_lock", "_scheduler")
+    def __init__(self, logger: logging.Logger):
+        super().__init__(daemon=True, name="resilience-scheduler")
+        self.logger = logger
+        self._stop_event = threading.Event()
+        # Makes "check stop, then reschedule" atomic with "set stop, then cancel"; otherwise a check
+        # rescheduled during stop() would survive the cancel and run() would spin until its deadline
+        self._stop_lock = threading.Lock()
+        # Waiting on the stop event makes the scheduler's sleeps interruptible
+        self._scheduler = sched.scheduler(time.monotonic, self._stop_event.wait)
+
+    def schedule_every(self, interval: float, func: Callable[[], Any], first_delay: Optional[float] = None):
+        """
+        Runs func every interval seconds, first after first_delay (defaults to interval).
+        Register checks before start(): an earlier event added later would not wake the sleeping scheduler.
+        """
+        deadline = time.monotonic() + (interval if first_delay is None else first_delay)
+
+        def run_and_reschedule():
+            nonlocal deadline
+            if self._stop_event.is_set():
+                return
+            try:
+                func()
+            except Exception as e:
+                self.logger.error("Error in scheduled resilience check: %s", e)
+            with self._stop_lock:
+                if not self._stop_event.is_set():
+                    # Fixed rate: the next deadline follows the previous one, so check duration does
+                    # not accumulate as drift (an overrunning check just runs again right away)
+                    deadline = max(deadline + interval, time.monotonic())
+                    self._scheduler.enterabs(deadline, 0, run_and_reschedule)
+
+        self._scheduler.enterabs(deadline, 0, run_and_reschedule)
+
+    def has_scheduled_checks(self) -> bool:
+        """Returns True if at least one check is registered."""
+        return not self._scheduler.empty()
+
+    def run(self):
+        self._scheduler.run()
+
+    def stop(self):
+        """Cancels all pending checks and wakes the scheduler so run() returns."""
+        with self._stop_lock:
+            self._stop_event.set()
+            for event in self._scheduler.queue:
+                try:
+                    self._scheduler.cancel(event)
+                except ValueError:
+                    pass # Already ran
+
+
 class ResilienceManager:
     """
     Orchestrates various resilience features for the AI coding system.
-    This is implemented as a singleton class to ensure a single point of control.
+    Use get_resilience_manager() for the shared, process-wide instance.
     """
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(ResilienceManager, cls).__new__(cls)
-                    cls._instance._initialized = False # Flag to ensure __init__ runs only once
-        return cls._instance
+    # get_health_status results are reused for this long, so frequent health probes stay cheap
+    HEALTH_STATUS_TTL_SECONDS = 2.0
 
     def __init__(self):
-        if self._initialized:
-            return
-        
+        """Loads the resilience config and starts the enabled monitors."""
         self.logger = get_logger("ResilienceManager", "operational")
         self.config = self._get_resilience_config()
 
@@ -417,8 +585,12 @@ class ResilienceManager:
         self.circuit_breaker: Optional[CircuitBreaker] = None
         self.auto_recovery: Optional[AutoRecoverySystem] = None
         self.performance_metrics: Optional[PerformanceMetrics] = None
+        # One thread runs every monitor's periodic check
+        self.scheduler = ResilienceScheduler(self.logger)
+
+        self._health_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._health_cache_lock = threading.Lock()
 
-        self._initialized = True
         self.start_monitors()
 
     def _get_resilience_config(self) -> Any:
@@ -431,16 +603,8 @@ class ResilienceManager:
             return app_config.resilience
         except Exception as e:
             self.logger.error(f"Failed to load application configuration for resilience: {e}. Using dummy/default values.")
-            # Create a dummy object that will return defaults via getattr
-            class FallbackResilienceConfig:
-                def __getattr__(self, name):
-                    self.logger.warning(f"Attempted to access missing resilience config attribute: {name}. Returning default (False/0).")
-                    if "enabled" in name or "enable" in name:
-                        return False
-                    if "interval_seconds" in name or "timeout_seconds" in name or "threshold" in name or "size" in name or "failures" in name or "sec" in name:
-                        return 0 # Sensible default for numeric values
-                    return None # Default for other types
-            return FallbackResilienceConfig()
+            # Plain attribute defaults (all features disabled); warned about once, above
+            return DummyResilienceConfig()
 
     def start_monitors(self):
         """Initializes and starts all enabled resilience monitors."""
@@ -458,14 +622,18 @@ class ResilienceManager:
                 timeout=self.config.heartbeat_timeout_seconds,
                 logger=self.logger
             )
-            self.heartbeat_monitor.start()
+            self.scheduler.schedule_every(self.heartbeat_monitor.interval, self.heartbeat_monitor.tick)
 
         if self.config.resource_monitoring_enabled:
             self.resource_manager = ResourceManager(
                 resilience_config=self.config, # Pass the entire resilience config object
                 logger=self.logger
             )
-            self.resource_manager.start()
+            # First tick one interval after ResourceManager primes cpu_percent, so the first
+            # CPU sample covers a real interval instead of ~0s of noise
+            self.scheduler.schedule_every(
+                self.config.resource_monitoring_interval_seconds, self.resource_manager.tick
+            )
 
         if self.config.task_queue_enabled:
             self.task_queue_manager = TaskQueueManager(
@@ -494,32 +662,35 @@ class ResilienceManager:
                 interval=self.config.auto_recovery_initial_delay_sec,
                 logger=self.logger
             )
-            self.auto_recovery.start()
+            self.scheduler.schedule_every(self.auto_recovery.interval, self.auto_recovery.tick)
 
         if self.config.performance_metrics_enabled:
             self.performance_metrics = PerformanceMetrics(
                 window=self.config.performance_window_size,
                 logger=self.logger
             )
-            self.performance_metrics.start()
+            self.scheduler.schedule_every(PerformanceMetrics.SUMMARY_INTERVAL_SECONDS, self.performance_metrics.tick)
 
+        if self.scheduler.has_scheduled_checks():
+            self.scheduler.start()
         self.logger.info("Resilience monitors started.")
 
     def stop_monitors(self):
         """Stops all running resilience monitors."""
         self.logger.info("Stopping resilience monitors...")
+        self.scheduler.stop()
+        if self.scheduler.is_alive():
+            self.scheduler.join(timeout=1) # Only an in-flight check can delay this
         if self.heartbeat_monitor:
             self.heartbeat_monitor.stop()
-            self.heartbeat_monitor.join(timeout=1)
         if self.resource_manager:
             self.resource_manager.stop()
-            self.resource_manager.join(timeout=1)
         if self.auto_recovery:
             self.auto_recovery.stop()
-            self.auto_recovery.join(timeout=1)
         if self.performance_metrics:
             self.performance_metrics.stop()
-            self.performance_metrics.join(timeout=1)
+        if self.task_queue_manager:
+            self.task_queue_manager.stop_workers()
         self.logger.info("Resilience monitors stopped.")
 
     def is_degraded(self) -> bool:
@@ -537,8 +708,33 @@ class ResilienceManager:
         """
         Returns a comprehensive dictionary of the current health status of all
         resilience components.
+
+        The result is cached for HEALTH_STATUS_TTL_SECONDS; resource metrics are
+        themselves only refreshed every resource_monitoring_interval_seconds.
         """
-        status = {
+        # (computed_at, status) in one tuple so readers never see a mismatched pair
+        computed_at, cached = self._health_cache
+        if cached is not None and time.monotonic() - computed_at < self.HEALTH_STATUS_TTL_SECONDS:
+            return self._copy_health_status(cached)
+
+        # Single flight: concurrent callers on an expired cache wait for one recomputation
+        with self._health_cache_lock:
+            computed_at, cached = self._health_cache
+            now = time.monotonic()
+            if cached is not None and now - computed_at < self.HEALTH_STATUS_TTL_SECONDS:
+                return self._copy_health_status(cached)
+            status = self._compute_health_status()
+            self._health_cache = (now, status)
+        return self._copy_health_status(status)
+
+    @staticmethod
+    def _copy_health_status(status: Dict[str, Any]) -> Dict[str, Any]:
+        """Copies a cached status, including its nested metric dicts, so callers cannot mutate the cache."""
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in status.items()}
+
+    def _compute_health_status(self) -> Dict[str, Any]:
+        """Builds the health status dictionary from the live components."""
+        return {
             "overall_degraded": self.is_degraded(),
             "heartbeat_healthy": self.heartbeat_monitor.is_healthy() if self.heartbeat_monitor else "N/A (disabled)",
             "resource_metrics": self.resource_manager.get_metrics() if self.resource_manager else "N/A (disabled)",
@@ -546,11 +742,35 @@ class ResilienceManager:
             "circuit_breaker_state": self.circuit_breaker.state if self.circuit_breaker else "N/A (disabled)",
             "performance_summary": self.performance_metrics.get_latest() if self.performance_metrics else "N/A (disabled)"
         }
-        return status
 
-# Global instance of ResilienceManager
-resilience_manager = ResilienceManager()
+def get_resilience_manager() -> ResilienceManager:
+    """
+    Returns the shared ResilienceManager, creating it (and starting its monitors) on first use.
 
-# Register atexit to ensure monitors are stopped gracefully on program exit
-import atexit
-atexit.register(resilience_manager.stop_monitors)
+    Importing this module no longer starts any threads; the atexit hook that stops the
+    monitors is registered together with the instance.
+    """
+    global _resilience_manager
+    # Lock-free once created: only the first calls take the lock
+    instance = _resilience_manager
+    if instance is None:
+        with _resilience_manager_lock:
+            instance = _resilience_manager
+            if instance is None:
+                instance = ResilienceManager()
+                # Ensure monitors are stopped gracefully on program exit
+                atexit.register(instance.stop_monitors)
+                # Publish only after setup so other threads never see a half-built instance
+                _resilience_manager = instance
+    return instance
+
+
+_resilience_manager: Optional[ResilienceManager] = None
+_resilience_manager_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Keeps `from app.core.resilience import resilience_manager` working (PEP 562), lazily."""
+    if name == "resilience_manager":
+        return get_resilience_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
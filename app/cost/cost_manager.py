@@ -5,10 +5,15 @@ Provides token counting, cost estimation, and budget management.
 
 import os
 import re
+import atexit
 import json
 import logging
+import threading
 import tiktoken
-from typing import Dict, List, Optional, Tuple, Union
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +23,50 @@ from app.core.config import get_config # Added import
 # Get logger
 logger = get_logger(__name__, "operational")
 
+# Process-wide tiktoken encoders by encoding key ("gpt-4" or "cl100k_base"), shared by every
+# CostManager. Loading one reads (or downloads) a BPE vocabulary file, which takes hundreds of ms
+_ENCODER_POOL: Dict[str, Any] = {}
+_ENCODER_POOL_LOCK = threading.Lock()
+
+
+def _get_pooled_encoder(encoding_key: str):
+    """Return the shared encoder for an encoding key, loading it on first use."""
+    encoder = _ENCODER_POOL.get(encoding_key)
+    if encoder is None:
+        with _ENCODER_POOL_LOCK:
+            encoder = _ENCODER_POOL.get(encoding_key)
+            if encoder is None:
+                try:
+                    if encoding_key == "gpt-4":
+                        encoder = tiktoken.encoding_for_model("gpt-4")
+                    else:
+                        encoder = tiktoken.get_encoding(encoding_key)
+                except Exception:
+                    # Fallback to general encoder
+                    encoder = tiktoken.get_encoding("cl100k_base")
+                _ENCODER_POOL[encoding_key] = encoder
+    return encoder
+
+
+@lru_cache(maxsize=128)
+def _resolve_encoding_name(model: str) -> str:
+    """Map a model name to its encoder pool key (computed once per model)."""
+    return "gpt-4" if "gpt" in model.lower() else "cl100k_base"
+
+
+def _warm_encoder_pool():
+    """Load the encoders in use ahead of the first count_tokens call."""
+    for encoding_key in ("gpt-4", "cl100k_base"):
+        try:
+            _get_pooled_encoder(encoding_key)
+        except Exception as e:
+            # Not fatal: count_tokens retries the load and falls back to a length estimate
+            logger.debug(f"Could not preload tiktoken encoding {encoding_key}: {e}")
+
+
+# Warm in the background so importing this module does not block on (or fail with) the vocabulary load
+threading.Thread(target=_warm_encoder_pool, name="tiktoken-warmup", daemon=True).start()
+
 @dataclass
 class CostEstimate:
     """Cost estimation result."""
@@ -58,10 +107,15 @@ class CostManager:
     - Cost analytics and reporting
     """
     
+    # Token counts remembered for repeated texts (same files across estimates and models)
+    TOKEN_COUNT_CACHE_SIZE = 4096
+    
     def __init__(self):
         self.pricing_db = self._load_pricing_database()
-        self.token_encoders = {}
         self.budget_limits = self._load_budget_configuration()
+        # LRU of (len(text), hash(text), encoding key) -> token count; shared by worker threads
+        self._token_count_cache: "OrderedDict[Tuple[int, int, str], int]" = OrderedDict()
+        self._token_count_lock = threading.Lock()
         
         # Load persistent cost history
         try:
@@ -73,6 +127,31 @@ class CostManager:
             self.cost_history = []
             self.cost_storage = None
         
+        # cost_history keeps load/record order (loaded history is newest first); summaries use this
+        # oldest-first copy and its timestamp column, so a period is a bisect plus a slice
+        self._history_lock = threading.Lock()
+        self._timeline: List[TaskCostResult] = sorted(self.cost_history, key=lambda c: c.timestamp)
+        self._timeline_timestamps: List[datetime] = [c.timestamp for c in self._timeline]
+        
+        # Saving rewrites the whole month's file, so records are saved in batches (and at exit)
+        self._flush_batch_size = self._load_flush_batch_size()
+        self._unsaved_records = 0
+        self._flush_lock = threading.Lock()
+        if self.cost_storage:
+            atexit.register(self.flush_cost_history)
+        
+    def _add_to_timeline(self, result: TaskCostResult):
+        """Insert a cost result into the timestamp-ordered timeline. Caller holds _history_lock."""
+        timestamps = self._timeline_timestamps
+        if not timestamps or result.timestamp >= timestamps[-1]:
+            # Usual case: results are recorded as they happen
+            timestamps.append(result.timestamp)
+            self._timeline.append(result)
+        else:
+            index = bisect_right(timestamps, result.timestamp)
+            timestamps.insert(index, result.timestamp)
+            self._timeline.insert(index, result)
+    
     def _load_pricing_database(self) -> Dict[str, Dict[str, float]]:
         """Load model pricing information from the Config class."""
         config = get_config()
@@ -149,32 +228,69 @@ class CostManager:
         
         return budget
     
+    def _load_flush_batch_size(self) -> int:
+        """Load how many recorded tasks are batched into one cost history save."""
+        config = get_config()
+        batch_size = getattr(config.cost, 'flush_batch_size', 10) if config.cost else 10
+        try:
+            return max(1, int(batch_size))
+        except (TypeError, ValueError):
+            logger.error(f"Invalid cost flush batch size: {batch_size}. Setting to default.")
+            return 10
+    
     def get_token_encoder(self, model: str):
-        """Get or create token encoder for model."""
-        if model not in self.token_encoders:
-            try:
-                # Try to get model-specific encoder
-                if "gpt" in model.lower():
-                    self.token_encoders[model] = tiktoken.encoding_for_model("gpt-4")
-                else:
-                    # Fallback to general encoder
-                    self.token_encoders[model] = tiktoken.get_encoding("cl100k_base")
-            except Exception:
-                # Ultimate fallback
-                self.token_encoders[model] = tiktoken.get_encoding("cl100k_base")
-        
-        return self.token_encoders[model]
+        """Get token encoder for model (from the shared, process-wide encoder pool)."""
+        return _get_pooled_encoder(_resolve_encoding_name(model))
+    
+    def _count_tokens_cached(self, text: str, encoding_key: str, encoder) -> int:
+        """Count tokens with encoder, reusing the count when the same text was encoded before."""
+        key = (len(text), hash(text), encoding_key)
+        cache = self._token_count_cache
+        with self._token_count_lock:
+            count = cache.get(key)
+            if count is not None:
+                cache.move_to_end(key)
+                return count
+        # Encode outside the lock so threads counting different texts do not serialize
+        count = len(encoder.encode(text))
+        with self._token_count_lock:
+            cache[key] = count
+            if len(cache) > self.TOKEN_COUNT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return count
     
     def count_tokens(self, text: str, model: str) -> int:
         """Count tokens in text for specific model."""
         try:
             encoder = self.get_token_encoder(model)
-            return len(encoder.encode(text))
+            return self._count_tokens_cached(text, _resolve_encoding_name(model), encoder)
         except Exception as e:
             logger.warning(f"Token counting failed for model {model}: {e}")
             # Rough estimate: ~4 characters per token
             return len(text) // 4
     
+    def _count_input_tokens(self, prompt: str, files_content: List[str], model: str) -> int:
+        """
+        Count tokens for a prompt followed by newline-separated file contents.
+
+        Each piece is encoded separately instead of joining everything into one string first,
+        which avoids copying every file and lets unchanged files hit the token count cache;
+        each separating newline counts as one token.
+        """
+        separators = max(len(files_content), 1)
+        try:
+            encoder = self.get_token_encoder(model)
+            encoding_key = _resolve_encoding_name(model)
+            return (
+                self._count_tokens_cached(prompt, encoding_key, encoder)
+                + sum(self._count_tokens_cached(content, encoding_key, encoder) for content in files_content)
+                + separators
+            )
+        except Exception as e:
+            logger.warning(f"Token counting failed for model {model}: {e}")
+            # Rough estimate: ~4 characters per token
+            return (len(prompt) + sum(len(content) for content in files_content) + separators) // 4
+    
     def estimate_output_tokens(self, input_tokens: int, task_type: str = "general") -> int:
         """Estimate output tokens based on input and task type."""
         # Base ratios for different task types
@@ -213,8 +329,7 @@ class CostManager:
                           model: str, task_type: str = "general") -> CostEstimate:
         """Estimate cost for a task before execution."""
         # Count input tokens
-        full_input = prompt + "\n" + "\n".join(files_content)
-        input_tokens = self.count_tokens(full_input, model)
+        input_tokens = self._count_input_tokens(prompt, files_content, model)
         
         # Estimate output tokens
         estimated_output = self.estimate_output_tokens(input_tokens, task_type)
@@ -270,15 +385,15 @@ class CostManager:
         )
         
         # Store in history
-        self.cost_history.append(result)
+        with self._history_lock:
+            self.cost_history.append(result)
+            self._add_to_timeline(result)
+            self._unsaved_records += 1
+            flush_due = self._unsaved_records >= self._flush_batch_size
         
-        # Save to persistent storage
-        if self.cost_storage:
-            try:
-                self.cost_storage.save_cost_history(self.cost_history)
-            except Exception as e:
-                if os.getenv("ENABLE_COST_LOGGING", "false").lower() == "true":
-                    logger.warning(f"Failed to save cost data: {e}")
+        # Save to persistent storage once a batch has accumulated
+        if flush_due:
+            self.flush_cost_history()
         
         # Log the cost only if logging is enabled
         if os.getenv("ENABLE_COST_LOGGING", "false").lower() == "true":
@@ -291,12 +406,36 @@ class CostManager:
         
         return result
     
+    def flush_cost_history(self):
+        """Save recorded costs not yet written to persistent storage."""
+        if not self.cost_storage:
+            return
+        # Serialized so an older snapshot can never overwrite a newer save
+        with self._flush_lock:
+            with self._history_lock:
+                if not self._unsaved_records:
+                    return
+                snapshot = list(self.cost_history)
+                unsaved = self._unsaved_records
+                self._unsaved_records = 0
+            try:
+                saved = self.cost_storage.save_cost_history(snapshot) is not False
+            except Exception as e:
+                saved = False
+                if os.getenv("ENABLE_COST_LOGGING", "false").lower() == "true":
+                    logger.warning(f"Failed to save cost data: {e}")
+            if not saved:
+                # Still unsaved: the next batch or the exit flush retries
+                with self._history_lock:
+                    self._unsaved_records += unsaved
+    
     def get_cost_summary(self, days: int = 7) -> Dict:
         """Get cost summary for specified period."""
         from datetime import timedelta
         
         cutoff_date = datetime.now() - timedelta(days=days)
-        recent_costs = [c for c in self.cost_history if c.timestamp >= cutoff_date]
+        with self._history_lock:
+            recent_costs = self._timeline[bisect_left(self._timeline_timestamps, cutoff_date):]
         
         if not recent_costs:
             return {"total_cost": 0, "task_count": 0, "average_cost": 0}
@@ -315,20 +454,18 @@ class CostManager:
     
     def _group_costs_by_model(self, cost_results: List[TaskCostResult]) -> Dict[str, Dict]:
         """Group cost results by model."""
-        model_costs = {}
+        # One hash lookup per record; totals are [total_cost, task_count, total_tokens]
+        totals = defaultdict(lambda: [0, 0, 0])
         for result in cost_results:
-            if result.model not in model_costs:
-                model_costs[result.model] = {
-                    "total_cost": 0,
-                    "task_count": 0,
-                    "total_tokens": 0
-                }
-            
-            model_costs[result.model]["total_cost"] += result.total_cost
-            model_costs[result.model]["task_count"] += 1
-            model_costs[result.model]["total_tokens"] += result.total_tokens
+            model_totals = totals[result.model]
+            model_totals[0] += result.total_cost
+            model_totals[1] += 1
+            model_totals[2] += result.total_tokens
         
-        return model_costs
+        return {
+            model: {"total_cost": total_cost, "task_count": task_count, "total_tokens": total_tokens}
+            for model, (total_cost, task_count, total_tokens) in totals.items()
+        }
     
     def export_cost_report(self, days: int = 30) -> str:
         """Export detailed cost report as JSON."""
@@ -361,17 +498,20 @@ def check_budget(estimated_cost: float) -> Tuple[bool, str]:
     return cost_manager.check_budget_limits(estimated_cost)
 
 
+# Punctuation stripped from prompts by generate_task_name (keeps letters, digits, _ and whitespace)
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+# Common words that say nothing about the task
+_TASK_NAME_SKIP_WORDS = frozenset({'create', 'make', 'build', 'write', 'generate', 'add', 'implement', 'a', 'an', 'the', 'for', 'with', 'that', 'simple', 'basic'})
+
+
 def generate_task_name(prompt: str) -> str:
     """Generate a descriptive task name from the prompt."""
-    import re
-    
     # Clean and truncate the prompt
-    clean_prompt = re.sub(r'[^\w\s]', '', prompt.lower())
+    clean_prompt = _NON_WORD_PATTERN.sub('', prompt.lower())
     words = clean_prompt.split()
     
     # Extract key words (skip common words)
-    skip_words = {'create', 'make', 'build', 'write', 'generate', 'add', 'implement', 'a', 'an', 'the', 'for', 'with', 'that', 'simple', 'basic'}
-    key_words = [word for word in words[:10] if word not in skip_words and len(word) > 2]
+    key_words = [word for word in words[:10] if word not in _TASK_NAME_SKIP_WORDS and len(word) > 2]
     
     # Generate name
     if key_words:
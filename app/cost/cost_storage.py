@@ -83,8 +83,8 @@ class CostStorage:
             print(f"Warning: Could not load cost history from {file_path}: {e}")
             return []
     
-    def save_cost_history(self, cost_history: List[TaskCostResult]):
-        """Save current month's cost history to storage file."""
+    def save_cost_history(self, cost_history: List[TaskCostResult]) -> bool:
+        """Save current month's cost history to storage file. Returns False if the save failed."""
         try:
             # Only save costs from current month to current file
             from datetime import datetime
@@ -121,9 +121,11 @@ class CostStorage:
             
             with open(self.storage_file, 'w') as f:
                 json.dump(data, f, indent=2)
+            return True
                 
         except Exception as e:
             print(f"Warning: Could not save cost history: {e}")
+            return False
     
     def export_to_csv(self, cost_history: List[TaskCostResult], output_file: str = None) -> str:
         """Export cost history to CSV format in costs directory."""
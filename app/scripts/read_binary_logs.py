@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Binary Log Reader
+
+Converts MessagePack log files (written when LOG_FILE_FORMAT=msgpack, e.g.
+logs/current/operational_2025-06.mpack) back into newline-delimited JSON so
+they can be inspected or fed to the existing JSON tooling.
+
+Each file is a sequence of frames: a 4-byte big-endian length followed by
+one msgpack-encoded log entry.
+"""
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def iter_log_entries(log_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the log entries stored in a length-prefixed MessagePack log file.
+
+    Args:
+        log_file: Path to a .mpack log file
+
+    Yields:
+        One decoded log entry per frame. A truncated final frame (e.g. from a
+        crash mid-write) is ignored.
+    """
+    if msgpack is None:
+        raise RuntimeError("Reading binary logs requires the msgpack package (pip install msgpack)")
+
+    with open(log_file, "rb") as f:
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return
+            (length,) = _FRAME_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield msgpack.unpackb(payload, raw=False)
+
+
+def main():
+    """Print the entries of one or more binary log files as JSON lines."""
+    parser = argparse.ArgumentParser(
+        description="Convert MessagePack log files (LOG_FILE_FORMAT=msgpack) to JSON lines."
+    )
+    parser.add_argument(
+        "log_files",
+        nargs="+",
+        type=Path,
+        help="One or more .mpack log files, e.g. logs/current/operational_2025-06.mpack"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent each JSON entry instead of printing one entry per line."
+    )
+    args = parser.parse_args()
+
+    try:
+        for log_file in args.log_files:
+            for entry in iter_log_entries(log_file):
+                print(json.dumps(entry, indent=2 if args.pretty else None, default=str))
+    except (RuntimeError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,9 @@ import time
 import uuid
 import threading
 import concurrent.futures
+import functools
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from queue import Queue, Full, Empty
 import traceback
 import re
@@ -88,33 +89,40 @@ class CircuitBreaker:
         self.reset_timeout = reset_timeout
         self.failure_count = 0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF-OPEN
-        self.last_failure_time = None
+        self.last_failure_time = None  # time.monotonic(), immune to wall-clock jumps
+        self.retry_at = 0.0  # monotonic deadline after which an OPEN breaker half-opens
         self.lock = threading.Lock()
 
     def call(self, func, *args, **kwargs):
-        with self.lock:
-            if self.state == "OPEN":
-                elapsed = time.time() - self.last_failure_time
-                if elapsed > self.reset_timeout:
-                    self.state = "HALF-OPEN"
-                else:
-                    raise Exception("Circuit breaker is OPEN. Rejecting calls.")
+        # CLOSED is the common case; a single attribute read is atomic, so only
+        # the OPEN/HALF-OPEN transitions need the lock.
+        if self.state != "CLOSED":
+            with self.lock:
+                if self.state == "OPEN":
+                    if time.monotonic() > self.retry_at:
+                        self.state = "HALF-OPEN"
+                    else:
+                        raise Exception("Circuit breaker is OPEN. Rejecting calls.")
 
         try:
             result = func(*args, **kwargs)
         except Exception as e:
             with self.lock:
                 self.failure_count += 1
-                self.last_failure_time = time.time()
-                if self.failure_count >= self.failure_threshold:
+                self.last_failure_time = time.monotonic()
+                self.retry_at = self.last_failure_time + self.reset_timeout
+                opened = self.failure_count >= self.failure_threshold
+                if opened:
                     self.state = "OPEN"
-                    logger.warning("Circuit breaker OPENED due to failures.")
+            if opened:
+                logger.warning("Circuit breaker OPENED due to failures.")
             raise e
         else:
-            with self.lock:
-                if self.state == "HALF-OPEN":
-                    self.state = "CLOSED"
-                    self.failure_count = 0
+            if self.state == "HALF-OPEN":
+                with self.lock:
+                    if self.state == "HALF-OPEN":
+                        self.state = "CLOSED"
+                        self.failure_count = 0
             return result
 
 
@@ -123,6 +131,132 @@ circuit_breaker = CircuitBreaker(
 )
 
 
+# Every decorator that sits directly above a def: (decorator name, function name).
+# One findall per file replaces a regex pass per decorator target.
+_DECORATED_DEF_PATTERN = re.compile(r'@([\w.]+)\s*(?:\([^)]*\))?\s*\n\s*def\s+(\w+)\s*\(')
+
+
+def _read_source(full_path: str) -> str:
+    """Read a source file as UTF-8 text."""
+    with open(full_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Parsed (decorator, function) pairs per file, with the (mtime_ns, size) version they were
+# parsed from, so an edit invalidates the entry; oldest entries are evicted past the cap
+_DECORATED_FUNCTIONS_CACHE_SIZE = 512
+_decorated_functions_cache: Dict[str, Tuple[Tuple[int, int], Tuple[Tuple[str, str], ...]]] = {}
+_decorated_functions_cache_lock = threading.Lock()
+
+
+def _parse_decorated_functions(full_path: str) -> Tuple[Tuple[str, str], ...]:
+    """Scan a file for (decorator, function) pairs."""
+    source = _read_source(full_path)
+    # A substring test is far cheaper than a regex pass over a file with no decorators
+    if '@' not in source:
+        return ()
+    return tuple(_DECORATED_DEF_PATTERN.findall(source))
+
+
+def _cached_decorated_functions(full_path: str, version: Tuple[int, int]) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """Return the cached pairs for this version of a file, or None if it must be parsed."""
+    cached = _decorated_functions_cache.get(full_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    return None
+
+
+def _find_decorated_functions(full_path: str, version: Tuple[int, int]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse a file into its (decorator, function) pairs and cache them for this file version.
+
+    Args:
+        full_path: Full path to the file to scan
+        version: (mtime_ns, size) of the file, from os.stat
+
+    Returns:
+        (decorator name, function name) pairs in file order; empty if the file is unreadable
+    """
+    try:
+        pairs = _parse_decorated_functions(full_path)
+    except Exception as e:
+        logger.warning(f"Could not read file {full_path} for target resolution: {e}")
+        return ()
+    with _decorated_functions_cache_lock:
+        _decorated_functions_cache.pop(full_path, None)
+        if len(_decorated_functions_cache) >= _DECORATED_FUNCTIONS_CACHE_SIZE:
+            del _decorated_functions_cache[next(iter(_decorated_functions_cache))]
+        _decorated_functions_cache[full_path] = (version, pairs)
+    return pairs
+
+
+# Upper bound on threads used to read files for target resolution
+TARGET_SCAN_MAX_WORKERS = 8
+_target_scan_executor: Optional[ThreadPoolExecutor] = None
+_target_scan_executor_lock = threading.Lock()
+
+
+def _get_target_scan_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool for target-resolution file reads, creating it on first use."""
+    global _target_scan_executor
+    if _target_scan_executor is None:
+        with _target_scan_executor_lock:
+            if _target_scan_executor is None:
+                _target_scan_executor = ThreadPoolExecutor(
+                    max_workers=TARGET_SCAN_MAX_WORKERS, thread_name_prefix="target-scan"
+                )
+    return _target_scan_executor
+
+
+def _find_decorated_functions_in_files(full_paths: List[str]) -> dict:
+    """
+    Parse several files into their (decorator, function) pairs, reading uncached files in parallel.
+
+    Every file is stat'ed first and unchanged files are served from the cache inline; only
+    the cache misses are read, on the shared pool when there is more than one (file reads
+    release the GIL, so the pool overlaps cold-cache I/O).
+
+    Args:
+        full_paths: Full paths of the files to scan
+
+    Returns:
+        Mapping of full path to its (decorator, function) pairs; empty for missing or unreadable files
+    """
+    parsed = {}
+    misses = []
+    for path in dict.fromkeys(full_paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            parsed[path] = ()
+            continue
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _cached_decorated_functions(path, version)
+        if cached is None:
+            misses.append((path, version))
+        else:
+            parsed[path] = cached
+
+    if len(misses) == 1:
+        path, version = misses[0]
+        parsed[path] = _find_decorated_functions(path, version)
+    elif misses:
+        executor = _get_target_scan_executor()
+        futures = [(path, executor.submit(_find_decorated_functions, path, version)) for path, version in misses]
+        for path, future in futures:
+            parsed[path] = future.result()
+    return parsed
+
+
+# Bare decorator names that resolve_target_elements expands even without a module prefix
+_BARE_DECORATOR_NAMES = frozenset(['tool', 'route', 'fixture', 'test', 'property', 'staticmethod', 'classmethod'])
+
+
+def _is_decorator_target(target: str) -> bool:
+    """Check if a target looks like a decorator (contains dots or is a common decorator name)."""
+    return '.' in target or target.lower() in _BARE_DECORATOR_NAMES
+
+
 def resolve_target_elements(
     target_elements: Optional[List[str]], 
     file_paths: List[str], 
@@ -142,51 +276,44 @@ def resolve_target_elements(
     Returns:
         Expanded list of actual function/class names found
     """
-    import re
-    
     if not target_elements:
         return []
+    # Common case: plain function/class names only, which are returned unchanged
+    if not any(_is_decorator_target(target) for target in target_elements):
+        return list(target_elements)
     
     resolved_targets = []
     decorator_expansions = {}
+    # Each file is parsed at most once, however many decorator targets are resolved
+    parsed_files = None
     
     for target in target_elements:
         is_decorator_target = False
         expanded_functions = []
         
         # Check if this looks like a decorator target (contains dots or common decorator patterns)
-        if ('.' in target or 
-            target.lower() in ['tool', 'route', 'fixture', 'test', 'property', 'staticmethod', 'classmethod']):
+        if _is_decorator_target(target):
             
+            if parsed_files is None:
+                parsed_files = _find_decorated_functions_in_files(
+                    [os.path.join(working_dir, file_path) for file_path in file_paths]
+                )
+            chained_prefix = target + "."
             # Try to find functions decorated with this target across all files
             for file_path in file_paths:
-                full_path = os.path.join(working_dir, file_path)
-                if not os.path.exists(full_path):
-                    continue
-                    
-                try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Framework-agnostic decorator patterns
-                    decorator_patterns = [
-                        # Basic patterns: @decorator, @decorator(), @decorator(args)
-                        rf'@{re.escape(target)}\s*(?:\([^)]*\))?\s*\n\s*def\s+(\w+)\s*\(',
-                        # Module patterns: @module.decorator, @module.decorator(), @module.decorator(args)
-                        rf'@{re.escape(target)}\s*(?:\([^)]*\))?\s*\n\s*def\s+(\w+)\s*\(',
-                        # Method chaining: @decorator.method, @decorator.method()
-                        rf'@{re.escape(target)}\.\w+\s*(?:\([^)]*\))?\s*\n\s*def\s+(\w+)\s*\(',
-                    ]
-                    
-                    for pattern in decorator_patterns:
-                        matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-                        if matches:
-                            expanded_functions.extend(matches)
-                            is_decorator_target = True
-                            
-                except Exception as e:
-                    logger.warning(f"Could not read file {full_path} for target resolution: {e}")
-                    continue
+                decorated = parsed_files[os.path.join(working_dir, file_path)]
+                
+                # Framework-agnostic decorator matches:
+                # @decorator, @decorator(), @decorator(args) and the module forms (@module.decorator...)
+                matches = [func for name, func in decorated if name == target]
+                # Method chaining: @decorator.method, @decorator.method()
+                matches.extend(
+                    func for name, func in decorated
+                    if name.startswith(chained_prefix) and "." not in name[len(chained_prefix):]
+                )
+                if matches:
+                    expanded_functions.extend(matches)
+                    is_decorator_target = True
         
         if is_decorator_target and expanded_functions:
             # Remove duplicates while preserving order
@@ -212,6 +339,52 @@ def resolve_target_elements(
     return resolved_targets
 
 
+@functools.lru_cache(maxsize=256)
+def _target_search_pattern(target: str) -> re.Pattern:
+    """
+    Compile every way find_targets_in_file recognises a target into one case-insensitive pattern.
+
+    A single search over the alternation replaces up to 15 separate re.search calls per
+    target; the compiled pattern is reused across files and calls.
+
+    Args:
+        target: Function, class or decorator name
+
+    Returns:
+        Compiled pattern matching any definition or decorator use of target
+    """
+    # Build decorator-aware patterns
+    # Support: @decorator, @decorator(), @decorator.method, @module.decorator, @module.decorator(), etc.
+    # Accept compound names (e.g., "pytest.fixture", "app.route", "mcp.tool")
+    decorator_patterns = [
+        rf'@{re.escape(target)}\s*\n',                # @decorator or @module.decorator
+        rf'@{re.escape(target)}\s*\(',                # @decorator( or @module.decorator(
+        rf'@{re.escape(target)}\s*\)\s*\n',           # @decorator() or @module.decorator()
+        rf'@{re.escape(target)}\s*\.\w+\s*\n',        # @decorator.method or @module.decorator.method
+        rf'@{re.escape(target)}\s*\.\w+\s*\(',        # @decorator.method( or @module.decorator.method(
+        rf'@{re.escape(target)}\s*\.\w+\s*\)\s*\n',   # @decorator.method() or @module.decorator.method()
+    ]
+
+    # Existing function/class/JS patterns (unchanged)
+    patterns = [
+        f'def {target}\\(',
+        f'class {target}\\b',
+        f'def {target}\\s*\\(',
+        f'class {target}\\s*[\\(:]',
+        f'function {target}\\(',  # JavaScript
+        f'const {target}\\s*=',   # JavaScript const functions
+        f'let {target}\\s*=',     # JavaScript let functions
+        f'var {target}\\s*=',     # JavaScript var functions
+        f'@{target}\\b',          # Decorator pattern (legacy, keep for compatibility)
+    ] + decorator_patterns
+
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+# Functions decorated with @mcp.tool(), for the "mcp.tool" target of find_targets_in_file
+_MCP_TOOL_DEF_PATTERN = re.compile(r'@mcp\.tool\(\)\s*\ndef\s+(\w+)\s*\(', re.MULTILINE)
+
+
 def find_targets_in_file(file_path: str, target_elements: List[str]) -> List[str]:
     """
     Find which target elements actually exist in a specific file.
@@ -223,58 +396,49 @@ def find_targets_in_file(file_path: str, target_elements: List[str]) -> List[str
     Returns:
         List of target elements that exist in the file
     """
-    import re
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        found_targets = []
-        for target in target_elements:
-            # Special handling for "mcp.tool" target: find all MCP tool functions decorated with @mcp.tool
-            if target == "mcp.tool":
-                # Find all function names decorated with @mcp.tool
-                tool_pattern = r'@mcp\.tool\(\)\s*\ndef\s+(\w+)\s*\('
-                matches = re.findall(tool_pattern, content, re.MULTILINE)
-                found_targets.extend(matches)
-                continue
-
-            # Build decorator-aware patterns
-            # Support: @decorator, @decorator(), @decorator.method, @module.decorator, @module.decorator(), etc.
-            # Accept compound names (e.g., "pytest.fixture", "app.route", "mcp.tool")
-            decorator_patterns = [
-                rf'@{re.escape(target)}\s*\n',                # @decorator or @module.decorator
-                rf'@{re.escape(target)}\s*\(',                # @decorator( or @module.decorator(
-                rf'@{re.escape(target)}\s*\)\s*\n',           # @decorator() or @module.decorator()
-                rf'@{re.escape(target)}\s*\.\w+\s*\n',        # @decorator.method or @module.decorator.method
-                rf'@{re.escape(target)}\s*\.\w+\s*\(',        # @decorator.method( or @module.decorator.method(
-                rf'@{re.escape(target)}\s*\.\w+\s*\)\s*\n',   # @decorator.method() or @module.decorator.method()
-            ]
-
-            # Existing function/class/JS patterns (unchanged)
-            patterns = [
-                f'def {target}\\(',
-                f'class {target}\\b',
-                f'def {target}\\s*\\(',
-                f'class {target}\\s*[\\(:]',
-                f'function {target}\\(',  # JavaScript
-                f'const {target}\\s*=',   # JavaScript const functions
-                f'let {target}\\s*=',     # JavaScript let functions
-                f'var {target}\\s*=',     # JavaScript var functions
-                f'@{target}\\b',          # Decorator pattern (legacy, keep for compatibility)
-            ] + decorator_patterns
-
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    found_targets.append(target)
-                    break
-
-        return found_targets
+        st = os.stat(file_path)
+        return list(_find_targets_in_file_version(file_path, st.st_mtime_ns, st.st_size, tuple(target_elements)))
 
     except Exception as e:
         logger.warning(f"Could not search for targets in {file_path}: {e}")
         return []
 
 
+@functools.lru_cache(maxsize=256)
+def _find_targets_in_file_version(file_path: str, mtime_ns: int, size: int, target_elements: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Search one version of a file for target elements; cached per (path, mtime, size, targets).
+
+    Only the (small) result is kept, not the file text, and an edit to the file invalidates the entry.
+    """
+    content = _read_source(file_path)
+    # Built lazily: only needed when a plain-name target reaches the substring check
+    content_lower = None
+
+    found_targets = []
+    for target in target_elements:
+        # Special handling for "mcp.tool" target: find all MCP tool functions decorated with @mcp.tool
+        if target == "mcp.tool":
+            # Find all function names decorated with @mcp.tool
+            found_targets.extend(_MCP_TOOL_DEF_PATTERN.findall(content))
+            continue
+
+        # Every pattern from _target_search_pattern contains the target literally (matched case-insensitively),
+        # so a target absent from the file can skip all of them. Only safe when the
+        # target has no regex metacharacters, since some patterns embed it unescaped.
+        if re.escape(target) == target:
+            if content_lower is None:
+                content_lower = content.lower()
+            if target.lower() not in content_lower:
+                continue
+
+        if _target_search_pattern(target).search(content):
+            found_targets.append(target)
+
+    return tuple(found_targets)
+
+
 def code_with_ai(
     prompt: str,
     working_dir: str,